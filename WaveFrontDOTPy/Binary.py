@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+import json
+import mmap
+import os
+import pathlib
+import struct
+import tempfile
+
+from WaveFrontDOTPy.Object import (
+    np,
+    STORAGE_MODE,
+    FaceInformation,
+    MaterialRun,
+    Vertex,
+    VertexNormal,
+    VertexTexture,
+    WaveObj,
+)
+
+######## START-Vars
+
+MAGIC = b"WFDOTPY\x00"
+FORMAT_VERSION = 3
+
+# magic, format version, reserved, header json length
+HEADER = struct.Struct("<8sIIQ")
+
+# every array starts on a multiple of this, relative to the data section
+ALIGNMENT = 64
+
+######## END-Vars
+######## START-Methods
+
+
+def align(offset: int) -> int:
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def requireNumpy():
+    if np is None:
+        raise ImportError("the binary layout requires numpy to be installed")
+
+
+@contextmanager
+def atomicWrite(path: str | pathlib.Path):
+    # the file is written next to `path` and moved over it so readers never
+    # see a half written file
+    path = pathlib.Path(path)
+    handle, temporary = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+
+    try:
+        with os.fdopen(handle, "wb") as target:
+            yield target
+
+        os.replace(temporary, path)
+
+    except BaseException:
+        os.unlink(temporary)
+        raise
+
+
+def writeArrays(path: str | pathlib.Path, meta: dict, arrays: dict[str, np.ndarray]):
+    # header + json table of contents, then raw little-endian arrays
+    requireNumpy()
+
+    table = {}
+    contiguous: list[tuple[int, np.ndarray]] = []
+    offset = 0
+
+    for name, values in arrays.items():
+        values = np.ascontiguousarray(values, dtype=values.dtype.newbyteorder("<"))
+        offset = align(offset)
+
+        table[name] = {
+            "dtype": values.dtype.str,
+            "shape": list(values.shape),
+            "offset": offset,
+        }
+        contiguous.append((offset, values))
+        offset += values.nbytes
+
+    header = json.dumps({"meta": meta, "arrays": table}).encode()
+    dataStart = align(HEADER.size + len(header))
+
+    with atomicWrite(path) as target:
+        target.write(HEADER.pack(MAGIC, FORMAT_VERSION, 0, len(header)))
+        target.write(header)
+
+        for offset, values in contiguous:
+            target.write(b"\x00" * (dataStart + offset - target.tell()))
+            target.write(values.data)
+
+
+def readArrays(path: str | pathlib.Path) -> tuple[dict, dict[str, np.ndarray]]:
+    # arrays come back as views into a private mapping of the file, nothing
+    # is copied until a page is written to (and writes never reach the file)
+    requireNumpy()
+
+    with open(path, "rb") as source:
+        if os.fstat(source.fileno()).st_size < HEADER.size:
+            raise ValueError(f'"{path}" is not a WavefrontDOTpy binary file')
+
+        mapped = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_COPY)
+
+    magic, version, _, length = HEADER.unpack_from(mapped, 0)
+
+    if magic != MAGIC:
+        raise ValueError(f'"{path}" is not a WavefrontDOTpy binary file')
+    if version != FORMAT_VERSION:
+        raise ValueError(f'"{path}" uses unsupported format version {version}')
+
+    header = json.loads(mapped[HEADER.size : HEADER.size + length])
+    dataStart = align(HEADER.size + length)
+
+    arrays = {}
+    for name, entry in header["arrays"].items():
+        dtype = np.dtype(entry["dtype"])
+        shape = tuple(entry["shape"])
+        count = int(np.prod(shape))
+
+        if count == 0:
+            arrays[name] = np.empty(shape, dtype=dtype)
+            continue
+
+        arrays[name] = np.frombuffer(
+            mapped, dtype=dtype, count=count, offset=dataStart + entry["offset"]
+        ).reshape(shape)
+
+    return header["meta"], arrays
+
+
+def attributeArray(
+    rows: list[tuple[float, ...]], width: int, minWidth: int, default: float
+) -> np.ndarray:
+    values = np.array(rows, dtype=np.float64).reshape(-1, width)
+
+    # trailing components that are all default were never in the file
+    if width > minWidth and (values[:, minWidth:] == default).all():
+        values = values[:, :minWidth]
+
+    return np.ascontiguousarray(values)
+
+
+def objectToArrays(obj: WaveObj) -> tuple[dict, dict[str, np.ndarray]]:
+    requireNumpy()
+
+    if obj.storage is STORAGE_MODE.NUMPY:
+        positions, normals, uvs = obj.positions, obj.normals, obj.uvs
+    else:
+        positions = attributeArray(
+            [(v.X, v.Y, v.Z, v.W) for v in obj.verticies], 4, 3, 1.0
+        )
+        normals = attributeArray(
+            [(vn.X, vn.Y, vn.Z) for vn in obj.vertexNormals], 3, 3, 0.0
+        )
+        uvs = attributeArray(
+            [(vt.X, vt.Y, vt.W) for vt in obj.vertexTextures], 3, 2, 0.0
+        )
+
+    faces = obj.faces
+    runs = [(r.materialId, r.firstFace, r.faceCount) for r in faces.materialRuns]
+
+    meta = {
+        "name": obj.name,
+        "isSmoothShaded": getattr(obj, "isSmoothShaded", None),
+        # run and mtllib ids index into symbols
+        "symbols": obj.symbols.names,
+        "linkedMTLLibs": obj.linkedMTLLibs.ids,
+        "activeMaterial": faces.activeMaterial,
+    }
+    arrays = {
+        "positions": positions,
+        "normals": normals,
+        "uvs": uvs,
+        "corners": np.frombuffer(
+            faces.corners, dtype=FaceInformation.typecodeOf(faces.corners)
+        ),
+        "offsets": np.frombuffer(faces.offsets, dtype=np.int64),
+        "shapes": np.frombuffer(faces.shapes, dtype=np.uint8),
+        "materialRuns": np.array(runs, dtype=np.int64).reshape(-1, 3),
+    }
+
+    return meta, arrays
+
+
+def objectFromArrays(
+    meta: dict, arrays: dict[str, np.ndarray], storage: STORAGE_MODE | str
+) -> WaveObj:
+    storage = STORAGE_MODE(storage)
+    obj = WaveObj(meta["name"], storage)
+    symbols = obj.symbols
+
+    # a fresh table hands the names out under the same ids again
+    for name in meta["symbols"]:
+        symbols.intern(name)
+
+    if meta["isSmoothShaded"] is not None:
+        obj.isSmoothShaded = meta["isSmoothShaded"]
+
+    obj.linkedMTLLibs.ids = list(meta["linkedMTLLibs"])
+
+    if storage is STORAGE_MODE.NUMPY:
+        obj.positions = arrays["positions"]
+        obj.normals = arrays["normals"]
+        obj.uvs = arrays["uvs"]
+    else:
+        obj.verticies = [Vertex(*row) for row in arrays["positions"].tolist()]
+        obj.vertexNormals = [VertexNormal(*row) for row in arrays["normals"].tolist()]
+        obj.vertexTextures = [VertexTexture(*row) for row in arrays["uvs"].tolist()]
+
+    # faces stay views too, FaceInformation copies them on the first edit
+    faces = obj.faces
+    faces.corners = memoryview(arrays["corners"])
+    faces.offsets = memoryview(arrays["offsets"])
+    faces.shapes = memoryview(arrays["shapes"])
+
+    faces.materialRuns = [MaterialRun(*run) for run in arrays["materialRuns"].tolist()]
+    faces.activeMaterial = meta["activeMaterial"]
+
+    return obj
+
+
+######## END-Methods
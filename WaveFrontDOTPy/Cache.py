@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import pathlib
+
+from WaveFrontDOTPy import Binary
+from WaveFrontDOTPy.Object import PARSER_VERSION, STORAGE_MODE, WaveObj
+
+######## START-Vars
+
+CACHE_SUFFIX = ".objcache"
+
+######## END-Vars
+######## START-Methods
+
+
+def cachePathFor(
+    sourcePath: pathlib.Path, cache: bool | str | pathlib.Path
+) -> pathlib.Path:
+    # cache=True keeps a sidecar next to the .obj, a folder collects them
+    if cache is True:
+        return sourcePath.with_name(sourcePath.name + CACHE_SUFFIX)
+
+    absolute = str(sourcePath.resolve()).encode()
+    digest = hashlib.sha1(absolute).hexdigest()[:16]
+
+    return pathlib.Path(cache, f"{sourcePath.stem}-{digest}{CACHE_SUFFIX}")
+
+
+def cacheKey(sourcePath: pathlib.Path, hashContent: bool = False) -> dict:
+    # with hashContent the content stands in for the path and mtime, so
+    # touched files and copies moved along with their cache=True sidecar
+    # still hit the cache. a cache folder names its files after the path,
+    # so copies never find the original's entry there
+    stat = os.stat(sourcePath)
+    key: dict = {
+        "size": stat.st_size,
+        "parser": PARSER_VERSION,
+    }
+
+    if hashContent:
+        with open(sourcePath, "rb") as source:
+            key["hash"] = hashlib.file_digest(source, "blake2b").hexdigest()
+    else:
+        key["path"] = str(sourcePath.resolve())
+        key["mtime"] = stat.st_mtime_ns
+
+    return key
+
+
+def readCache(
+    cachePath: pathlib.Path, key: dict, storage: STORAGE_MODE | str
+) -> WaveObj | None:
+    if not cachePath.exists():
+        return None
+
+    try:
+        meta, arrays = Binary.readArrays(cachePath)
+
+        if meta.get("key") != key:
+            return None
+
+        return Binary.objectFromArrays(meta, arrays, storage)
+
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def writeCache(cachePath: pathlib.Path, key: dict, obj: WaveObj):
+    meta, arrays = Binary.objectToArrays(obj)
+    meta["key"] = key
+
+    # a cache that can not be written is just a slower next decode
+    try:
+        cachePath.parent.mkdir(parents=True, exist_ok=True)
+        Binary.writeArrays(cachePath, meta, arrays)
+    except OSError:
+        pass
+
+
+######## END-Methods
@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+import json
+import pathlib
+import struct
+
+from WaveFrontDOTPy import Binary
+from WaveFrontDOTPy.Object import np, WaveObj
+
+######## START-Vars
+
+GLB_MAGIC = b"glTF"
+GLB_VERSION = 2
+GLB_HEADER = struct.Struct("<4sII")
+GLB_CHUNK = struct.Struct("<I4s")
+GLB_JSON = b"JSON"
+GLB_BIN = b"BIN\x00"
+
+# glTF enums
+FLOAT = 5126
+UNSIGNED_SHORT = 5123
+UNSIGNED_INT = 5125
+ARRAY_BUFFER = 34962
+ELEMENT_ARRAY_BUFFER = 34963
+TRIANGLES = 4
+
+######## END-Vars
+######## START-Methods
+
+
+def resolveIndices(indices: np.ndarray, count: int) -> np.ndarray:
+    # 1-based OBJ indices to 0-based, -1 where the corner has no index.
+    # decode() already resolved relative indices against the counts at each
+    # face, negatives left over come from faces added by hand and count from
+    # the end
+    return np.where(
+        indices > 0, indices - 1, np.where(indices < 0, count + indices, -1)
+    )
+
+
+def triangulate(offsets: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    # fans every polygon around its first corner, gives the corner rows of
+    # each triangle and the face it came from. faces under 3 corners are dropped
+    starts = offsets[:-1]
+    triangles = np.maximum(np.diff(offsets) - 2, 0)
+    faceOf = np.repeat(np.arange(len(starts)), triangles)
+
+    local = np.arange(len(faceOf)) - np.repeat(
+        np.cumsum(triangles) - triangles, triangles
+    )
+    first = starts[faceOf]
+
+    corners = np.stack([first, first + local + 1, first + local + 2], axis=1)
+    return corners, faceOf
+
+
+def buildPrimitives(obj: WaveObj) -> tuple[dict, dict[str, np.ndarray], list[tuple]]:
+    # one vertex per distinct v/vt/vn triple, shared by every primitive, and
+    # one primitive (index range) per material
+    meta, arrays = Binary.objectToArrays(obj)
+
+    positions = arrays["positions"][:, :3]
+    normals = arrays["normals"]
+    uvs = arrays["uvs"][:, :2]
+
+    triples = arrays["corners"].astype(np.int64).reshape(-1, 3)
+    triples = np.stack(
+        [
+            resolveIndices(triples[:, 0], len(positions)),
+            resolveIndices(triples[:, 1], len(uvs)),
+            resolveIndices(triples[:, 2], len(normals)),
+        ],
+        axis=1,
+    )
+
+    corners, faceOf = triangulate(arrays["offsets"])
+    used = np.unique(corners)
+    unique, inverse = np.unique(triples[used], axis=0, return_inverse=True)
+
+    remap = np.zeros(len(triples), dtype=np.int64)
+    remap[used] = inverse.reshape(-1)
+    triangles = remap[corners]
+
+    # faces outside of every material run get -1
+    faceMaterial = np.full(len(arrays["offsets"]) - 1, -1, dtype=np.int64)
+    for materialId, firstFace, faceCount in arrays["materialRuns"].tolist():
+        faceMaterial[firstFace : firstFace + faceCount] = materialId
+
+    triangleMaterial = faceMaterial[faceOf]
+    order = np.argsort(triangleMaterial, kind="stable")
+    triangles = triangles[order]
+    triangleMaterial = triangleMaterial[order]
+
+    materials, firsts, counts = np.unique(
+        triangleMaterial, return_index=True, return_counts=True
+    )
+    groups = list(zip(materials.tolist(), firsts.tolist(), counts.tolist()))
+
+    vertexArrays: dict[str, np.ndarray] = {}
+
+    if len(positions):
+        vertexArrays["POSITION"] = positions[unique[:, 0]]
+
+    if len(uvs) and (unique[:, 1] >= 0).any():
+        texcoords = uvs[np.maximum(unique[:, 1], 0)].copy()
+        # OBJ puts v = 0 at the bottom of the image, glTF at the top
+        texcoords[:, 1] = 1.0 - texcoords[:, 1]
+        texcoords[unique[:, 1] < 0] = 0.0
+        vertexArrays["TEXCOORD_0"] = texcoords
+
+    # glTF normals have to be unit length, so NORMAL is left out unless every
+    # vertex has a usable one
+    if len(normals) and (unique[:, 2] >= 0).all():
+        vertexNormals = normals[unique[:, 2]]
+        lengths = np.linalg.norm(vertexNormals, axis=1, keepdims=True)
+
+        if (lengths > 0).all():
+            vertexArrays["NORMAL"] = vertexNormals / lengths
+
+    vertexArrays = {
+        name: np.ascontiguousarray(values, dtype="<f4")
+        for name, values in vertexArrays.items()
+    }
+
+    indexType = "<u2" if len(unique) <= 0xFFFF else "<u4"
+    indices = np.ascontiguousarray(triangles.reshape(-1), dtype=indexType)
+
+    return meta, vertexArrays | {"indices": indices}, groups
+
+
+def objectToGLB(obj: WaveObj) -> tuple[dict, list[np.ndarray]]:
+    Binary.requireNumpy()
+
+    meta, arrays, groups = buildPrimitives(obj)
+    indices = arrays.pop("indices")
+
+    # a mesh needs at least one primitive and accessors can't be empty
+    if not len(indices):
+        raise ValueError(
+            f'"{obj.name}" has no faces with 3 or more corners, nothing to write as glTF'
+        )
+
+    document: dict = {
+        "asset": {"version": "2.0", "generator": "WavefrontDOTpy"},
+        "scene": 0,
+        "scenes": [{"nodes": [0]}],
+        "nodes": [{"mesh": 0, "name": meta["name"]}],
+        "meshes": [{"name": meta["name"], "primitives": []}],
+        "materials": [],
+        "accessors": [],
+        "bufferViews": [],
+        "buffers": [],
+    }
+
+    blobs: list[np.ndarray] = []
+    offset = 0
+
+    def addView(values: np.ndarray, target: int) -> int:
+        nonlocal offset
+        # every view starts 4-byte aligned, the padding is written as its own blob
+        if offset % 4:
+            blobs.append(np.zeros(4 - offset % 4, dtype=np.uint8))
+            offset += 4 - offset % 4
+
+        document["bufferViews"].append(
+            {
+                "buffer": 0,
+                "byteOffset": offset,
+                "byteLength": values.nbytes,
+                "target": target,
+            }
+        )
+        blobs.append(values)
+        offset += values.nbytes
+
+        return len(document["bufferViews"]) - 1
+
+    attributes = {}
+    for name, values in arrays.items():
+        accessor = {
+            "bufferView": addView(values, ARRAY_BUFFER),
+            "componentType": FLOAT,
+            "count": len(values),
+            "type": f"VEC{values.shape[1]}",
+        }
+
+        if name == "POSITION" and len(values):
+            accessor["min"] = values.min(axis=0).tolist()
+            accessor["max"] = values.max(axis=0).tolist()
+
+        document["accessors"].append(accessor)
+        attributes[name] = len(document["accessors"]) - 1
+
+    indexView = addView(indices, ELEMENT_ARRAY_BUFFER)
+    componentType = UNSIGNED_SHORT if indices.dtype.itemsize == 2 else UNSIGNED_INT
+
+    # runs hold symbol ids, glTF wants the used materials numbered from 0
+    materialIndex: dict[int, int] = {}
+
+    for materialId, firstTriangle, triangleCount in groups:
+        primitive = {
+            "attributes": attributes,
+            "indices": len(document["accessors"]),
+            "mode": TRIANGLES,
+        }
+        if materialId >= 0:
+            if materialId not in materialIndex:
+                materialIndex[materialId] = len(document["materials"])
+                document["materials"].append({"name": meta["symbols"][materialId]})
+
+            primitive["material"] = materialIndex[materialId]
+
+        document["accessors"].append(
+            {
+                "bufferView": indexView,
+                "byteOffset": firstTriangle * 3 * indices.dtype.itemsize,
+                "componentType": componentType,
+                "count": triangleCount * 3,
+                "type": "SCALAR",
+            }
+        )
+        document["meshes"][0]["primitives"].append(primitive)
+
+    document["buffers"].append({"byteLength": offset})
+
+    if not document["materials"]:
+        del document["materials"]
+
+    return document, blobs
+
+
+def writeGLB(obj: WaveObj, path: str | pathlib.Path):
+    document, blobs = objectToGLB(obj)
+
+    header = json.dumps(document, separators=(",", ":")).encode()
+    header += b" " * (-len(header) % 4)
+
+    binaryLength = document["buffers"][0]["byteLength"]
+    binaryPadding = -binaryLength % 4
+
+    total = GLB_HEADER.size + GLB_CHUNK.size + len(header)
+    total += GLB_CHUNK.size + binaryLength + binaryPadding
+
+    with Binary.atomicWrite(path) as target:
+        target.write(GLB_HEADER.pack(GLB_MAGIC, GLB_VERSION, total))
+        target.write(GLB_CHUNK.pack(len(header), GLB_JSON))
+        target.write(header)
+        target.write(GLB_CHUNK.pack(binaryLength + binaryPadding, GLB_BIN))
+
+        for values in blobs:
+            target.write(values.data)
+
+        target.write(b"\x00" * binaryPadding)
+
+
+######## END-Methods
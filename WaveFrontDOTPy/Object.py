@@ -1,10 +1,32 @@
 from __future__ import annotations
 
+from array import array
+import bisect
+import bz2
+from collections import deque
+from collections.abc import MutableSequence, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
 from datetime import datetime
 import enum
+from functools import partial
+import gzip
+import hashlib
+import io
+from itertools import chain, starmap
+import lzma
+import mmap
+from operator import attrgetter
 import os
 import pathlib
-from typing import Callable
+import re
+import shutil
+import tempfile
+from typing import IO, Any, Callable, Iterable, Iterator, NamedTuple
+
+try:
+    import numpy as np
+except ImportError:  # numpy is only needed for the array storage modes
+    np = None
 
 ######## START-Vars
 
@@ -47,6 +69,102 @@ TAG_IDENTIFIER_CHARACTERS = {
 # for exportin'
 TAG_IDENTIFIER_TO_STRING = {v: k for k, v in TAG_IDENTIFIER_CHARACTERS.items()}
 
+# for decodin' straight from a mapped file
+TAG_IDENTIFIER_BYTES = {k.encode(): v for k, v in TAG_IDENTIFIER_CHARACTERS.items()}
+
+# runs of at least BLOCK_MIN_LINES v/vn/vt/f lines are converted in one go
+# when numpy is around, a run ends on the first line with another tag and is
+# cut into pieces of at most BLOCK_MAX_BYTES to keep the temporaries small
+BLOCK_MIN_LINES = 8
+BLOCK_MAX_BYTES = 1 << 20
+BLOCK_ENDS = {
+    tag: re.compile(rb"\n(?!%s[ \t])" % tag) for tag in (b"v", b"vn", b"vt", b"f")
+}
+
+# values per face corner and the "/" and "//" every corner token must contain
+FACE_BLOCK_LAYOUTS = {
+    FACE_SHAPE_IDENTIFIER.VERTEX_ONLY: (1, 0, 0),
+    FACE_SHAPE_IDENTIFIER.VERTEX_AND_TEXTURE: (2, 1, 0),
+    FACE_SHAPE_IDENTIFIER.VERTEX_AND_NORMAL: (2, 2, 1),
+    FACE_SHAPE_IDENTIFIER.VERTEX_AND_TEXTURE_AND_NORMAL: (3, 2, 0),
+}
+SLASH_TO_SPACE = bytes.maketrans(b"/", b" ")
+
+# face corners start out as uint16 and are widened to int32 for the first
+# index that does not fit, negative (relative) indices included
+NARROW_INDEX = "H"
+WIDE_INDEX = "i"
+
+# face corner separators by token type, lines are either str or bytes
+FACE_SEPARATORS: dict[type, tuple[str | bytes, str | bytes]] = {
+    str: ("/", "//"),
+    bytes: (b"/", b"//"),
+}
+
+
+# bump whenever decode() output changes, parse caches keyed on it go stale
+PARSER_VERSION = 1
+
+
+class STORAGE_MODE(enum.Enum):
+    OBJECTS = "objects"
+    NUMPY = "numpy"
+
+
+class PRECISION(enum.Enum):
+    # dtype of the attribute arrays, FLOAT32 is numpy storage only
+    FLOAT64 = "float64"
+    FLOAT32 = "float32"
+
+
+class FLOAT_FORMAT(enum.Enum):
+    # FIXED pads to `digits` decimals, TRIMMED drops the trailing zeros of
+    # that, SHORTEST is the shortest text that reads back as the same float
+    FIXED = "fixed"
+    TRIMMED = "trimmed"
+    SHORTEST = "shortest"
+
+
+# export formats this many rows per template application and hands the file
+# chunks of roughly EXPORT_BUFFER_BYTES
+EXPORT_BLOCK_ROWS = 1 << 14
+EXPORT_BUFFER_BYTES = 1 << 20
+EXPORT_FLOAT_DIGITS = 6
+EXPORT_HEADER = "# Exported with WavefrontDOTpy\n"
+
+# a value that formats as all zeros but kept its sign, "-0.000000" or "-0"
+NEGATIVE_ZERO = re.compile(r"(?<= )-(0(?:\.0*)?)(?=[ \n])")
+
+# every corner consumes its whole v/vt/vn triple, "%.0s" swallows the unused
+FACE_CORNER_TEMPLATES = {
+    FACE_SHAPE_IDENTIFIER.VERTEX_ONLY: "%d%.0s%.0s",
+    FACE_SHAPE_IDENTIFIER.VERTEX_AND_TEXTURE: "%d/%d%.0s",
+    FACE_SHAPE_IDENTIFIER.VERTEX_AND_NORMAL: "%d//%.0s%d",
+    FACE_SHAPE_IDENTIFIER.VERTEX_AND_TEXTURE_AND_NORMAL: "%d/%d/%d",
+}
+
+# compressed files are recognized by their last suffix and decompressed as
+# they are read, COMPRESSED_READ_BYTES at a time
+COMPRESSION_OPENERS: dict[str, Callable[..., IO]] = {
+    ".gz": gzip.open,
+    ".bz2": bz2.open,
+    ".xz": lzma.open,
+}
+COMPRESSED_READ_BYTES = 1 << 22
+
+# lines whose original bytes are kept by decode(keepRaw=True), usemtl lines
+# are part of the face section they sit in
+RAW_SECTIONS = {
+    b"v": TAG_IDENTIFIER.VERTEX,
+    b"vt": TAG_IDENTIFIER.VERTEX_TEXTURE,
+    b"vn": TAG_IDENTIFIER.VERTEX_NORMAL,
+    b"f": TAG_IDENTIFIER.POLYGONAL_FACE_ELEMENT,
+    b"usemtl": TAG_IDENTIFIER.POLYGONAL_FACE_ELEMENT,
+}
+
+# a block of export text that can be formatted anywhere, even in a worker
+type FormatJob = tuple[Callable[..., str], tuple]
+
 ######## END-Vars
 ######## START-Exceptions
 
@@ -93,6 +211,32 @@ class TokenConsumers:
         nextSpace = _input.find(" ")
         return _input[:nextSpace]
 
+    @staticmethod
+    def asText(token: str | bytes) -> str:
+        return token.decode() if isinstance(token, bytes) else token
+
+    @staticmethod
+    def leftoverOf(line: str | bytes) -> str:
+        # everything after the tag, stripped but with inner spacing intact, so
+        # "usemtl a  b" still matches its "newmtl a  b"
+        parts = line.split(None, 1)
+        leftover = parts[1].strip() if len(parts) > 1 else parts[0][:0]
+
+        return TokenConsumers.asText(leftover)
+
+    @staticmethod
+    def joinLeftover(tokens: list[str] | list[bytes]) -> str:
+        # everything after the tag, space separated. for error messages, names
+        # go through leftoverOf
+        if isinstance(tokens[0], bytes):
+            return b" ".join(tokens[1:]).decode()
+
+        return " ".join(tokens[1:])
+
+    @staticmethod
+    def isComment(token: str | bytes) -> bool:
+        return token[:1] in ("#", b"#")
+
 
 class Parsers:
 
@@ -167,6 +311,83 @@ class Parsers:
         raise ShapeException(line)
 
     class Faces:
+        @staticmethod
+        def shapeFromToken(token: str | bytes) -> FACE_SHAPE_IDENTIFIER:
+            slash, doubleSlash = FACE_SEPARATORS[type(token)]
+            slashes = token.count(slash)
+
+            if slashes == 0:
+                return FACE_SHAPE_IDENTIFIER.VERTEX_ONLY
+            if slashes == 1:
+                return FACE_SHAPE_IDENTIFIER.VERTEX_AND_TEXTURE
+            if slashes == 2:
+                if doubleSlash in token:
+                    return FACE_SHAPE_IDENTIFIER.VERTEX_AND_NORMAL
+                return FACE_SHAPE_IDENTIFIER.VERTEX_AND_TEXTURE_AND_NORMAL
+
+            raise ShapeException(TokenConsumers.asText(token))
+
+        @staticmethod
+        def cornersFromTokens(
+            tokens: list[str] | list[bytes],
+        ) -> tuple[FACE_SHAPE_IDENTIFIER, list[int]]:
+            # tokens[0] is the "f" tag, the shape is decided by the first corner.
+            # corners come back flat as v, vt, vn triples with 0 for "missing"
+            if len(tokens) < 2:
+                raise ShapeException(TokenConsumers.asText(tokens[0]))
+
+            shape = Parsers.Faces.shapeFromToken(tokens[1])
+            slash, doubleSlash = FACE_SEPARATORS[type(tokens[0])]
+            count = len(tokens) - 1
+            corners = [0] * (count * 3)
+
+            try:
+                match shape:
+                    case FACE_SHAPE_IDENTIFIER.VERTEX_ONLY:
+                        corners[0::3] = map(int, tokens[1:])
+
+                    case FACE_SHAPE_IDENTIFIER.VERTEX_AND_TEXTURE:
+                        values = slash.join(tokens[1:]).split(slash)
+                        if len(values) != count * 2:
+                            raise ValueError()
+
+                        corners[0::3] = map(int, values[0::2])
+                        corners[1::3] = map(int, values[1::2])
+
+                    case FACE_SHAPE_IDENTIFIER.VERTEX_AND_NORMAL:
+                        values = doubleSlash.join(tokens[1:]).split(doubleSlash)
+                        if len(values) != count * 2:
+                            raise ValueError()
+
+                        corners[0::3] = map(int, values[0::2])
+                        corners[2::3] = map(int, values[1::2])
+
+                    case FACE_SHAPE_IDENTIFIER.VERTEX_AND_TEXTURE_AND_NORMAL:
+                        values = slash.join(tokens[1:]).split(slash)
+                        if len(values) != count * 3:
+                            raise ValueError()
+
+                        corners = list(map(int, values))
+
+            except ValueError:
+                raise ShapeException(
+                    f'{TokenConsumers.joinLeftover(tokens)}\nExpected Shape: "{repr(shape)}"'
+                )
+
+            return shape, corners
+
+        @staticmethod
+        def fromTokens(tokens: list[str] | list[bytes]) -> list[VertexIndexer]:
+            shape, corners = Parsers.Faces.cornersFromTokens(tokens)
+
+            indexers: list[VertexIndexer] = []
+            for i in range(0, len(corners), 3):
+                indexer = VertexIndexer(corners[i], corners[i + 1], corners[i + 2])
+                indexer.outputShape = shape
+                indexers.append(indexer)
+
+            return indexers
+
         @staticmethod
         def vertexTextureNormalParser(line: str):
             line = TokenConsumers.consumeTagAndReturnLeftover(line)
@@ -248,7 +469,11 @@ class Parsers:
             return indexers
 
 
+# element classes are slotted, no per-instance __dict__ keeps them a fraction
+# of the size and makes attribute access a plain descriptor lookup
 class Vertex[T = float]:
+    __slots__ = ("X", "Y", "Z", "W")
+
     X: T
     Y: T
     Z: T
@@ -262,6 +487,8 @@ class Vertex[T = float]:
 
 
 class VertexNormal[T = float]:
+    __slots__ = ("X", "Y", "Z")
+
     X: T
     Y: T
     Z: T
@@ -273,6 +500,8 @@ class VertexNormal[T = float]:
 
 
 class VertexTexture[T = float]:
+    __slots__ = ("X", "Y", "W")
+
     X: T
     Y: T
     W: T
@@ -284,6 +513,14 @@ class VertexTexture[T = float]:
 
 
 class VertexIndexer:
+    __slots__ = (
+        "outputShape",
+        "vertexIndex",
+        "vertexTextureIndex",
+        "vertexNormalIndex",
+        "linkedMaterial",
+    )
+
     outputShape: FACE_SHAPE_IDENTIFIER
     vertexIndex: int
     vertexTextureIndex: int
@@ -303,154 +540,1986 @@ class VertexParameterSpace[T = float]:
     pass
 
 
+def componentProperty(column: int, default: float) -> property:
+    # a Vertex* attribute backed by one column of the view's array, columns
+    # the array does not have yet read as `default` and are added on write
+    def get(view: ElementView) -> float:
+        rows = view.source.rows
+
+        if column >= rows.shape[1]:
+            return default
+
+        return float(rows[view.index, column])
+
+    def set(view: ElementView, value: float):
+        view.source.widen(column + 1)[view.index, column] = value
+
+    return property(get, set)
+
+
+def initView(view: ElementView, source: AttributeView, index: int):
+    view.source = source
+    view.index = index
+
+
+# views subclass the element they stand in for, so isinstance() checks keep
+# working. the inherited component slots go unused, the properties win
+class VertexView(Vertex):
+    __slots__ = ("source", "index")
+    __init__ = initView
+
+    source: AttributeView
+    index: int
+
+    X = componentProperty(0, 0.0)
+    Y = componentProperty(1, 0.0)
+    Z = componentProperty(2, 0.0)
+    W = componentProperty(3, 1.0)
+
+
+class VertexNormalView(VertexNormal):
+    __slots__ = ("source", "index")
+    __init__ = initView
+
+    source: AttributeView
+    index: int
+
+    X = componentProperty(0, 0.0)
+    Y = componentProperty(1, 0.0)
+    Z = componentProperty(2, 0.0)
+
+
+class VertexTextureView(VertexTexture):
+    __slots__ = ("source", "index")
+    __init__ = initView
+
+    source: AttributeView
+    index: int
+
+    X = componentProperty(0, 0.0)
+    Y = componentProperty(1, 0.0)
+    W = componentProperty(2, 0.0)
+
+
+type ElementView = VertexView | VertexNormalView | VertexTextureView
+
+
+class AttributeView(Sequence):
+    # stands in for obj.verticies & co with STORAGE_MODE.NUMPY, elements are
+    # made on access and read / write straight through to the array, so
+    # nothing is materialised up front. the array is looked up on every
+    # access, replacing obj.positions is picked up by existing views
+    obj: WaveObj
+    name: str
+    element: type[ElementView]
+    defaults: tuple[float, ...]
+
+    def __init__(
+        self,
+        obj: WaveObj,
+        name: str,
+        element: type[ElementView],
+        defaults: tuple[float, ...],
+    ) -> None:
+        self.obj = obj
+        self.name = name
+        self.element = element
+        self.defaults = defaults
+
+    @property
+    def rows(self) -> np.ndarray:
+        rows = getattr(self.obj, self.name)
+
+        if rows is None:
+            return np.empty((0, len(self.defaults)))
+
+        return rows
+
+    def widen(self, width: int) -> np.ndarray:
+        rows = self.rows
+
+        if rows.shape[1] < width:
+            wider = np.empty((len(rows), width), dtype=rows.dtype)
+            wider[:] = self.defaults[:width]
+            wider[:, : rows.shape[1]] = rows
+
+            setattr(self.obj, self.name, wider)
+            rows = wider
+
+        return rows
+
+    def __len__(self) -> int:
+        rows = getattr(self.obj, self.name)
+        return 0 if rows is None else len(rows)
+
+    def __getitem__(self, index: int | slice):
+        if isinstance(index, slice):
+            return [self.element(self, i) for i in range(*index.indices(len(self)))]
+
+        count = len(self)
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError(f"{self.name} index out of range")
+
+        return self.element(self, index)
+
+    def __setitem__(self, index: int, value: Vertex | VertexNormal | VertexTexture):
+        view = self[index]
+
+        # the element's own slots are the component names
+        for name in self.element.__base__.__slots__:
+            setattr(view, name, getattr(value, name))
+
+    def __iter__(self) -> Iterator[ElementView]:
+        return map(partial(self.element, self), range(len(self)))
+
+
+class AttributeBuffer:
+    # flat growable float storage for one vertex attribute, rows are padded
+    # out to `width` with `defaults` so they can be reshaped to (N, width)
+    width: int
+    minWidth: int
+    usedWidth: int
+    defaults: tuple[float, ...]
+    values: array
+
+    def __init__(self, defaults: tuple[float, ...], minWidth: int) -> None:
+        self.width = len(defaults)
+        self.minWidth = minWidth
+        self.usedWidth = minWidth
+        self.defaults = defaults
+        self.values = array("d")
+
+    def appendTokens(self, tokens: list[str] | list[bytes], line: str | bytes = b""):
+        # also registered as a Decoder handler, which passes the line along
+        count = len(tokens) - 1
+
+        if count < self.minWidth or count > self.width:
+            raise ShapeException(TokenConsumers.joinLeftover(tokens))
+
+        self.values.extend(map(float, tokens[1:]))
+
+        if count != self.width:
+            self.values.extend(self.defaults[count:])
+
+            if count > self.usedWidth:
+                self.usedWidth = count
+        else:
+            self.usedWidth = count
+
+    def appendBlock(self, block: bytes, lines: int, tag: bytes) -> int:
+        # parses a whole run of same-tag lines at once and returns the bytes
+        # used, 0 when the run has to go through appendTokens line by line
+        # (mixed or invalid component counts, anything not a plain float)
+
+        # count the values of every line, a run whose total only happens to
+        # divide by the line count must not be reshaped into the wrong rows
+        raw = np.frombuffer(block, dtype=np.uint8)
+        isSpace = raw <= 32
+        tokenStarts = ~isSpace
+        tokenStarts[1:] &= isSpace[:-1]
+        lineEnds = np.flatnonzero(raw == 10)
+        if len(lineEnds) < lines:
+            lineEnds = np.append(lineEnds, len(raw))
+        tokensPerLine = np.diff(
+            np.searchsorted(np.flatnonzero(tokenStarts), lineEnds[:lines]), prepend=0
+        )
+
+        count = int(tokensPerLine[0]) - 1
+        if count < self.minWidth or count > self.width:
+            return 0
+        if (tokensPerLine != count + 1).any():
+            return 0
+
+        try:
+            values = np.fromstring(block.translate(None, tag), sep=" ")
+        except ValueError:
+            return 0
+
+        if values.size != count * lines:
+            return 0
+
+        rows = values.reshape(lines, count)
+
+        if count != self.width:
+            padded = np.empty((lines, self.width))
+            padded[:] = self.defaults
+            padded[:, :count] = rows
+            rows = padded
+
+            self.usedWidth = max(self.usedWidth, count)
+        else:
+            self.usedWidth = count
+
+        self.values.frombytes(rows.tobytes())
+        return len(block)
+
+    def __len__(self) -> int:
+        return len(self.values) // self.width
+
+    def extend(self, other: AttributeBuffer):
+        self.values.extend(other.values)
+        self.usedWidth = max(self.usedWidth, other.usedWidth)
+
+    def toObjects[T](self, factory: Callable[..., T]) -> list[T]:
+        values = iter(self.values)
+        return list(starmap(factory, zip(*[values] * self.width)))
+
+    def toNumpy(self, dtype=None):
+        rows = np.frombuffer(self.values, dtype=np.float64).reshape(-1, self.width)
+
+        if self.usedWidth != self.width:
+            rows = rows[:, : self.usedWidth]
+
+        return np.ascontiguousarray(rows, dtype=dtype or np.float64)
+
+
+# FACE_SHAPE_IDENTIFIER by value, cheaper than calling the enum per face
+FACE_SHAPES = tuple(FACE_SHAPE_IDENTIFIER)
+
+
+class SymbolTable:
+    # per decode pool of object, group, material and mtllib names. every name
+    # is stored once and gets a small int id, [id] goes back
+    names: list[str]
+    ids: dict[str, int]
+    # raw line -> id, so a repeated "usemtl x" line costs a dict hit instead
+    # of a decode + strip + new str. kept apart from ids, a line isn't a name
+    lines: dict[str | bytes, int]
+
+    def __init__(self) -> None:
+        self.names = []
+        self.ids = {}
+        self.lines = {}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __getitem__(self, symbolId: int) -> str:
+        return self.names[symbolId]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.ids
+
+    def intern(self, name: str) -> int:
+        if (symbolId := self.ids.get(name)) is None:
+            symbolId = len(self.names)
+            self.ids[name] = symbolId
+            self.names.append(name)
+
+        return symbolId
+
+    def internLine(self, line: str | bytes) -> int:
+        # the name after the tag, see TokenConsumers.leftoverOf
+        if (symbolId := self.lines.get(line)) is None:
+            symbolId = self.intern(TokenConsumers.leftoverOf(line))
+            self.lines[line] = symbolId
+
+        return symbolId
+
+    def nameOf(self, line: str | bytes) -> str:
+        return self.names[self.internLine(line)]
+
+
+class SymbolList(MutableSequence):
+    # a list[str] on the outside, symbol ids on the inside
+    symbols: SymbolTable
+    ids: list[int]
+
+    def __init__(self, symbols: SymbolTable, names: Iterable[str] = ()) -> None:
+        self.symbols = symbols
+        self.ids = [symbols.intern(name) for name in names]
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.symbols[symbolId] for symbolId in self.ids[index]]
+
+        return self.symbols[self.ids[index]]
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            self.ids[index] = [self.symbols.intern(name) for name in value]
+        else:
+            self.ids[index] = self.symbols.intern(value)
+
+    def __delitem__(self, index):
+        del self.ids[index]
+
+    def insert(self, index: int, value: str):
+        self.ids.insert(index, self.symbols.intern(value))
+
+    def appendId(self, symbolId: int):
+        self.ids.append(symbolId)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Sequence) and not isinstance(other, (str, bytes)):
+            return list(self) == list(other)
+
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+class MaterialRun:
+    materialId: int
+    firstFace: int
+    faceCount: int
+
+    def __init__(self, materialId: int, firstFace: int, faceCount: int = 0):
+        self.materialId = materialId
+        self.firstFace = firstFace
+        self.faceCount = faceCount
+
+    def __repr__(self) -> str:
+        return f"MaterialRun({self.materialId}, {self.firstFace}, {self.faceCount})"
+
+
 class FaceInformation:
-    indexers: list[list[VertexIndexer]]
+    # CSR layout: face N owns corners[offsets[N] * 3 : offsets[N + 1] * 3],
+    # each corner being a flat v, vt, vn triple (0 when the index is missing).
+    # corners are NARROW_INDEX or WIDE_INDEX, see widenCorners().
+    # faces loaded from a binary file are memoryviews until first edited
+    corners: array | memoryview
+    offsets: array | memoryview
+    shapes: array | memoryview
+    # materials are applied to faces as ranges of symbol ids, faces outside
+    # of every run have no material
+    symbols: SymbolTable
+    materialRuns: list[MaterialRun]
+    activeMaterial: int | None
+
+    def __init__(self, symbols: SymbolTable | None = None):
+        self.corners = array(NARROW_INDEX)
+        self.offsets = array("q", [0])
+        self.shapes = array("B")
+        self.symbols = SymbolTable() if symbols is None else symbols
+        self.materialRuns = []
+        self.activeMaterial = None
+
+    def __len__(self) -> int:
+        return len(self.shapes)
+
+    @property
+    def indexers(self) -> FaceIndexers:
+        return FaceIndexers(self)
+
+    @property
+    def materialNames(self) -> list[str]:
+        # materials the faces use, in order of first use
+        used = dict.fromkeys(run.materialId for run in self.materialRuns)
+        return [self.symbols[materialId] for materialId in used]
+
+    def addRun(self, materialId: int, firstFace: int, faceCount: int = 0):
+        runs = self.materialRuns
+
+        # a usemtl without any faces after it never becomes a run
+        if runs and runs[-1].faceCount == 0 and runs[-1].firstFace == firstFace:
+            runs.pop()
+
+        if (
+            runs
+            and runs[-1].materialId == materialId
+            and runs[-1].firstFace + runs[-1].faceCount == firstFace
+        ):
+            runs[-1].faceCount += faceCount
+            return
+
+        runs.append(MaterialRun(materialId, firstFace, faceCount))
+
+    def useMaterial(self, name: str | None):
+        if name is None:
+            self.activeMaterial = None
+            return
+
+        self.useSymbol(self.symbols.intern(name))
+
+    def useSymbol(self, materialId: int):
+        self.activeMaterial = materialId
+        self.addRun(materialId, len(self))
+
+    def renameMaterial(self, name: str, newName: str):
+        # runs point at the new symbol, the old name stays in the table
+        oldId = self.symbols.ids.get(name)
+
+        if oldId is None or (
+            oldId != self.activeMaterial
+            and all(run.materialId != oldId for run in self.materialRuns)
+        ):
+            raise KeyError(name)
+
+        newId = self.symbols.intern(newName)
+
+        for run in self.materialRuns:
+            if run.materialId == oldId:
+                run.materialId = newId
+
+        if self.activeMaterial == oldId:
+            self.activeMaterial = newId
+
+    def materialOf(self, index: int) -> str | None:
+        runs = self.materialRuns
+        at = bisect.bisect_right(runs, index, key=lambda run: run.firstFace) - 1
+
+        if at < 0 or index >= runs[at].firstFace + runs[at].faceCount:
+            return None
+
+        return self.symbols[runs[at].materialId]
+
+    @staticmethod
+    def typecodeOf(values: array | memoryview) -> str:
+        if isinstance(values, array):
+            return values.typecode
+
+        return values.format.lstrip("<=@")
+
+    def makeGrowable(self):
+        for name in ("corners", "offsets", "shapes"):
+            view = getattr(self, name)
+
+            if isinstance(view, memoryview):
+                grown = array(self.typecodeOf(view))
+                grown.frombytes(view.cast("B"))
+                setattr(self, name, grown)
+
+    def widenCorners(self):
+        if self.corners.typecode != WIDE_INDEX:
+            self.corners = array(WIDE_INDEX, self.corners)
+
+    def addFace(self, shape: FACE_SHAPE_IDENTIFIER, corners: list[int]):
+        if not isinstance(self.shapes, array):
+            self.makeGrowable()
+
+        count = len(self.corners)
+        try:
+            self.corners.extend(corners)
+        except OverflowError:
+            # extend() keeps whatever it appended before the bad index
+            del self.corners[count:]
+            self.widenCorners()
+            self.corners.extend(corners)
+
+        self.offsets.append(len(self.corners) // 3)
+        self.shapes.append(shape.value)
+
+        if self.activeMaterial is not None:
+            self.materialRuns[-1].faceCount += 1
+
+    def appendBlock(self, block: bytes, lines: int) -> int:
+        # parses a run of "f" lines at once, the shape comes from the first
+        # corner and the run is cut at the first line that does not match it.
+        # returns the bytes used, 0 when the run has to go line by line
+        firstLine = block[: block.find(b"\n")].split()
+        if len(firstLine) < 2:
+            return 0
+
+        shape = Parsers.Faces.shapeFromToken(firstLine[1])
+        perCorner, slashes, doubleSlashes = FACE_BLOCK_LAYOUTS[shape]
+
+        raw = np.frombuffer(block, dtype=np.uint8)
+        isSpace = raw <= 32
+        isNewline = raw == 10
+        isSlash = raw == 47
+
+        tokenStarts = ~isSpace
+        tokenStarts[1:] &= isSpace[:-1]
+        tokenOf = np.cumsum(tokenStarts) - 1
+        tokenLine = np.cumsum(isNewline)[tokenStarts]
+        tokenCount = len(tokenLine)
+
+        tokensPerLine = np.bincount(tokenLine, minlength=lines)[:lines]
+        isTag = np.zeros(tokenCount, dtype=bool)
+        isTag[np.cumsum(tokensPerLine) - tokensPerLine] = True
+
+        slashCount = np.bincount(tokenOf[isSlash], minlength=tokenCount)
+        doubleCount = np.bincount(
+            tokenOf[:-1][isSlash[:-1] & isSlash[1:]], minlength=tokenCount
+        )
+        badToken = ~isTag & ((slashCount != slashes) | (doubleCount != doubleSlashes))
+        badLine = np.bincount(tokenLine[badToken], minlength=lines)[:lines] > 0
+        badLine |= tokensPerLine < 2
+
+        goodLines = int(badLine.argmax()) if badLine.any() else lines
+        if goodLines == 0:
+            return 0
+
+        if goodLines != lines:
+            block = block[: int(np.flatnonzero(isNewline)[goodLines - 1]) + 1]
+
+        self.makeGrowable()
+
+        try:
+            values = np.fromstring(
+                block.translate(SLASH_TO_SPACE, b"f"), dtype=np.int64, sep=" "
+            )
+        except ValueError:
+            return 0
+
+        cornerCounts = tokensPerLine[:goodLines] - 1
+        corners = int(cornerCounts.sum())
+
+        if values.size != corners * perCorner:
+            return 0
+
+        values = values.reshape(corners, perCorner)
+        triples = np.zeros((corners, 3), dtype=np.int32)
+
+        match shape:
+            case FACE_SHAPE_IDENTIFIER.VERTEX_AND_NORMAL:
+                triples[:, 0] = values[:, 0]
+                triples[:, 2] = values[:, 1]
+            case _:
+                triples[:, :perCorner] = values
+
+        if self.corners.typecode == NARROW_INDEX and (
+            triples.min() < 0 or triples.max() > 0xFFFF
+        ):
+            self.widenCorners()
+
+        self.corners.frombytes(triples.astype(self.corners.typecode).tobytes())
+        self.offsets.frombytes(
+            (self.offsets[-1] + np.cumsum(cornerCounts, dtype=np.int64)).tobytes()
+        )
+        self.shapes.frombytes(bytes([shape.value]) * goodLines)
+
+        if self.activeMaterial is not None:
+            self.materialRuns[-1].faceCount += goodLines
+
+        return len(block)
+
+    def resolveRelative(
+        self, firstCorner: int, counts: tuple[int, int, int]
+    ) -> list[int]:
+        # negative indices from `firstCorner` on count back from `counts`, the
+        # v, vt and vn there were when those faces were read. gives the flat
+        # corner positions that were changed
+        corners = self.corners
+        if corners.typecode != WIDE_INDEX:
+            return []
+
+        if np is None:
+            resolved = []
+            for position in range(firstCorner, len(corners)):
+                if (index := corners[position]) < 0:
+                    corners[position] = counts[position % 3] + index + 1
+                    resolved.append(position)
+
+            return resolved
+
+        tail = np.frombuffer(corners, dtype=np.int32)[firstCorner:]
+        at = np.flatnonzero(tail < 0)
+        tail[at] += np.array(counts, dtype=np.int32)[(firstCorner + at) % 3] + 1
+        del tail
+
+        return (at + firstCorner).tolist()
+
+    def extendFaces(self, other: FaceInformation):
+        self.makeGrowable()
+
+        faceBase = len(self)
+        cornerBase = self.offsets[-1]
+
+        otherCorners = other.corners
+        if self.typecodeOf(otherCorners) == WIDE_INDEX:
+            self.widenCorners()
+        if self.typecodeOf(otherCorners) != self.corners.typecode:
+            otherCorners = array(self.corners.typecode, otherCorners)
+
+        self.corners.extend(otherCorners)
+        self.offsets.extend([offset + cornerBase for offset in other.offsets[1:]])
+        self.shapes.extend(other.shapes)
+
+        # faces ahead of the first usemtl in `other` continue our material
+        leading = other.materialRuns[0].firstFace if other.materialRuns else len(other)
+        if self.activeMaterial is not None and leading:
+            self.addRun(self.activeMaterial, faceBase, leading)
+
+        # ids from another table (a worker's) are moved over to ours
+        def ownId(materialId: int) -> int:
+            if other.symbols is self.symbols:
+                return materialId
+
+            return self.symbols.intern(other.symbols[materialId])
+
+        for run in other.materialRuns:
+            self.addRun(ownId(run.materialId), faceBase + run.firstFace, run.faceCount)
+
+        if other.activeMaterial is not None:
+            self.activeMaterial = ownId(other.activeMaterial)
+
+    def fingerprint(self, upTo: int | None = None) -> bytes:
+        # covers the first `upTo` faces and the materials they use, so a
+        # fingerprint taken earlier tells whether faces were only appended
+        upTo = len(self) if upTo is None else upTo
+        corners = self.offsets[upTo] * 3
+
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(self.corners[:corners])
+        digest.update(self.offsets[: upTo + 1])
+        digest.update(self.shapes[:upTo])
+
+        runs = [
+            (
+                self.symbols[run.materialId],
+                run.firstFace,
+                min(run.faceCount, upTo - run.firstFace),
+            )
+            for run in self.materialRuns
+            if run.faceCount and run.firstFace < upTo
+        ]
+        digest.update(repr(runs).encode())
+
+        return digest.digest()
+
+    def addIndexers(self, indexers: list[VertexIndexer]):
+        shape = FACE_SHAPE_IDENTIFIER.VERTEX_AND_TEXTURE_AND_NORMAL
+        material = None
+
+        if indexers:
+            shape = getattr(indexers[0], "outputShape", shape)
+            material = indexers[0].linkedMaterial
+
+        corners: list[int] = []
+        for indexer in indexers:
+            corners.append(indexer.vertexIndex)
+            corners.append(indexer.vertexTextureIndex)
+            corners.append(indexer.vertexNormalIndex)
+
+        active = self.activeMaterial
+        if material != (None if active is None else self.symbols[active]):
+            self.useMaterial(material)
+
+        self.addFace(shape, corners)
+
+    def getIndexers(self, index: int) -> list[VertexIndexer]:
+        start = self.offsets[index] * 3
+        end = self.offsets[index + 1] * 3
+        shape = FACE_SHAPES[self.shapes[index]]
+        material = self.materialOf(index)
+        corners = self.corners
+
+        indexers: list[VertexIndexer] = []
+        for i in range(start, end, 3):
+            indexer = VertexIndexer(corners[i], corners[i + 1], corners[i + 2])
+            indexer.outputShape = shape
+            indexer.linkedMaterial = material
+            indexers.append(indexer)
+
+        return indexers
+
+
+class FaceIndexers:
+    # list[list[VertexIndexer]]-like adapter over FaceInformation, the
+    # indexers are built on access so editing them does not write back
+    faces: FaceInformation
+
+    def __init__(self, faces: FaceInformation):
+        self.faces = faces
+
+    def __len__(self) -> int:
+        return len(self.faces)
+
+    def __getitem__(self, index: int | slice):
+        if isinstance(index, slice):
+            return [self.faces.getIndexers(i) for i in range(len(self))[index]]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("face index out of range")
+
+        return self.faces.getIndexers(index)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self.faces.getIndexers(i)
+
+    def append(self, indexers: list[VertexIndexer]):
+        self.faces.addIndexers(indexers)
+
+
+class Formatters:
+    # sections are formatted a block at a time by repeating one %-template
+    # over a flat tuple of the block's values
+
+    @staticmethod
+    def rowTemplate(
+        tag: TAG_IDENTIFIER,
+        width: int,
+        hidden: int = 0,
+        floatSpec: str = f"%.{EXPORT_FLOAT_DIGITS}f",
+    ) -> str:
+        # `hidden` trailing values are consumed but not written
+        return f"{TAG_IDENTIFIER_TO_STRING[tag]}{(' ' + floatSpec) * width}{'%.0s' * hidden}\n"
+
+    @staticmethod
+    def attributeTable(obj: WaveObj, tag: TAG_IDENTIFIER):
+        # (N, k) array on numpy storage, list of row tuples otherwise
+        if obj.storage is STORAGE_MODE.NUMPY:
+            match tag:
+                case TAG_IDENTIFIER.VERTEX:
+                    table = obj.positions
+                case TAG_IDENTIFIER.VERTEX_TEXTURE:
+                    table = obj.uvs[:, :2]
+                case TAG_IDENTIFIER.VERTEX_NORMAL:
+                    table = obj.normals
+                case _:
+                    raise UnknownTagException(str(tag))
+
+            if table.dtype == np.float32:
+                return Formatters.shortestDecimals(table)
+
+            return table
+
+        match tag:
+            case TAG_IDENTIFIER.VERTEX:
+                return list(map(attrgetter("X", "Y", "Z", "W"), obj.verticies))
+            case TAG_IDENTIFIER.VERTEX_TEXTURE:
+                return list(map(attrgetter("X", "Y"), obj.vertexTextures))
+            case TAG_IDENTIFIER.VERTEX_NORMAL:
+                return list(map(attrgetter("X", "Y", "Z"), obj.vertexNormals))
+
+        raise UnknownTagException(str(tag))
+
+    @staticmethod
+    def shortestDecimals(values: np.ndarray) -> np.ndarray:
+        # float32 values as the float64 nearest to the shortest decimal that
+        # reads back as the same float32, so 0.1f prints as 0.1 and not as
+        # 0.10000000149011612 (or 123.456f as 123.456000, not 123.456001).
+        # tries 6..9 significant digits, 9 always round trips
+        wide = values.astype(np.float64)
+        result = wide.copy()
+        pending = np.isfinite(wide) & (wide != 0)
+
+        with np.errstate(divide="ignore"):
+            exponent = np.floor(np.log10(np.abs(wide)))
+
+        for digits in range(6, 10):
+            if not pending.any():
+                break
+
+            at = np.flatnonzero(pending)
+            scale = digits - 1 - exponent.flat[at]
+            power = 10.0 ** np.abs(scale)
+            x = wide.flat[at]
+
+            # both operands stay exact integers / powers of ten, one rounding
+            rounded = np.where(
+                scale >= 0, np.round(x * power) / power, np.round(x / power) * power
+            )
+            exact = rounded.astype(np.float32) == values.flat[at]
+
+            result.flat[at[exact]] = rounded[exact]
+            pending.flat[at[exact]] = False
+
+        return result
+
+    @staticmethod
+    def attributeSection(
+        tag: TAG_IDENTIFIER,
+        table,
+        floatFormat: FLOAT_FORMAT = FLOAT_FORMAT.FIXED,
+        digits: int = EXPORT_FLOAT_DIGITS,
+        deterministic: bool = False,
+    ) -> Iterator[FormatJob]:
+        for start in range(0, len(table), EXPORT_BLOCK_ROWS):
+            block = table[start : start + EXPORT_BLOCK_ROWS]
+            yield (
+                Formatters.attributeBlock,
+                (tag, block, floatFormat, digits, deterministic),
+            )
+
+    @staticmethod
+    def floatSpec(floatFormat: FLOAT_FORMAT, digits: int) -> str:
+        # repr() of a float is already the shortest round-tripping text
+        if floatFormat is FLOAT_FORMAT.SHORTEST:
+            return "%r"
+
+        return f"%.{digits}f"
+
+    @staticmethod
+    def attributeBlock(
+        tag: TAG_IDENTIFIER,
+        block,
+        floatFormat: FLOAT_FORMAT,
+        digits: int,
+        deterministic: bool = False,
+    ) -> str:
+        if not isinstance(block, list):
+            block = block.tolist()
+
+        width = len(block[0])
+        floatSpec = Formatters.floatSpec(floatFormat, digits)
+        template = Formatters.rowTemplate(tag, width, 0, floatSpec)
+        values = tuple(chain.from_iterable(block))
+
+        # a 4th vertex component is only written when it isn't the default 1
+        if tag is not TAG_IDENTIFIER.VERTEX or width != 4:
+            text = (template * len(block)) % values
+        elif all(row[3] == 1.0 for row in block):
+            short = Formatters.rowTemplate(tag, 3, 1, floatSpec)
+            text = (short * len(block)) % values
+        else:
+            short = Formatters.rowTemplate(tag, 3, 1, floatSpec)
+            rows = [template if row[3] != 1.0 else short for row in block]
+            text = "".join(rows) % values
+
+        if floatFormat is FLOAT_FORMAT.TRIMMED:
+            text = Formatters.trimZeros(text, digits)
+
+        # only float blocks, names elsewhere may legitimately contain "-0"
+        if deterministic:
+            text = NEGATIVE_ZERO.sub(r"\1", text)
+
+        return text
+
+    @staticmethod
+    def trimZeros(text: str, digits: int) -> str:
+        # every value has exactly `digits` decimals, so that many passes of
+        # dropping a zero in front of a separator can't reach the integer part.
+        # plain replaces beat a regex by a wide margin here
+        if digits == 0:
+            return text
+
+        for _ in range(digits):
+            length = len(text)
+            text = text.replace("0 ", " ").replace("0\n", "\n")
+
+            if len(text) == length:
+                break
+
+        return text.replace(". ", " ").replace(".\n", "\n")
+
+    @staticmethod
+    def blockFingerprint(block) -> bytes:
+        digest = hashlib.blake2b(digest_size=16)
+
+        if isinstance(block, list):
+            width = len(block[0]) if block else 0
+            digest.update(repr((len(block), width)).encode())
+            digest.update(array("d", chain.from_iterable(block)))
+        else:
+            digest.update(repr(block.shape).encode())
+            digest.update(np.ascontiguousarray(block, dtype=np.float64))
+
+        return digest.digest()
+
+    @staticmethod
+    def faceTemplate(shape: FACE_SHAPE_IDENTIFIER, count: int) -> str:
+        corners = " ".join([FACE_CORNER_TEMPLATES[shape]] * count)
+        return f"{TAG_IDENTIFIER_TO_STRING[TAG_IDENTIFIER.POLYGONAL_FACE_ELEMENT]} {corners}\n"
+
+    @staticmethod
+    def faceSegments(faces: FaceInformation, breaks: Iterable[int]) -> list[int]:
+        # boundaries of face ranges that share one shape and corner count
+        offsets = faces.offsets
+        shapes = faces.shapes
+        total = len(faces)
+
+        if np is not None:
+            keys = np.diff(np.frombuffer(offsets, dtype=np.int64)) * len(FACE_SHAPES)
+            keys += np.frombuffer(shapes, dtype=np.uint8)
+            edges = set((np.flatnonzero(keys[1:] != keys[:-1]) + 1).tolist())
+        else:
+            edges = {
+                i
+                for i in range(1, total)
+                if shapes[i] != shapes[i - 1]
+                or offsets[i + 1] - offsets[i] != offsets[i] - offsets[i - 1]
+            }
+
+        edges.update(breaks)
+        edges.update(range(0, total, EXPORT_BLOCK_ROWS))
+        edges.add(total)
+
+        return sorted(edges)
+
+    @staticmethod
+    def faceBlock(template: str, faceCount: int, corners: Iterable[int]) -> str:
+        return (template * faceCount) % tuple(corners)
+
+    @staticmethod
+    def faceSection(
+        faces: FaceInformation, firstFace: int = 0
+    ) -> Iterator[str | FormatJob]:
+        corners = faces.corners
+        offsets = faces.offsets
+        templates: dict[tuple[int, int], str] = {}
+
+        # usemtl is only written when the material actually changes
+        materialAt: dict[int, int] = {}
+        lastMaterial: int | None = None
+        for run in faces.materialRuns:
+            if run.faceCount and run.materialId != lastMaterial:
+                materialAt[run.firstFace] = lastMaterial = run.materialId
+
+        edges = Formatters.faceSegments(faces, materialAt)
+
+        if firstFace:
+            edges = [firstFace] + [edge for edge in edges if edge > firstFace]
+
+        for start, end in zip(edges, edges[1:]):
+            material = materialAt.get(start)
+            if material is not None:
+                yield f"{TAG_IDENTIFIER_TO_STRING[TAG_IDENTIFIER.USE_MTL_LIB]} {faces.symbols[material]}\n"
+
+            first = offsets[start]
+            count = offsets[start + 1] - first
+
+            if count == 0:
+                continue
+
+            key = (faces.shapes[start], count)
+            if (template := templates.get(key)) is None:
+                shape = FACE_SHAPES[key[0]]
+                template = templates[key] = Formatters.faceTemplate(shape, count)
 
-    def __init__(self):
-        self.indexers = []
+            block = corners[first * 3 : offsets[end] * 3]
+
+            # views over a mapped binary file can't be sent to a worker
+            if isinstance(block, memoryview):
+                block = block.tolist()
+
+            yield (Formatters.faceBlock, (template, end - start, block))
+
+    @staticmethod
+    def runJobs(
+        jobs: Iterable[str | bytes | FormatJob], workers: int | None
+    ) -> Iterator[str | bytes]:
+        if workers is None or workers < 2:
+            for job in jobs:
+                yield job[0](*job[1]) if isinstance(job, tuple) else job
+            return
+
+        # a couple of blocks per worker are kept in flight, results are
+        # handed out in the order the jobs came in
+        with ProcessPoolExecutor(workers) as pool:
+            pending: deque[str | bytes | Future] = deque()
+
+            for job in jobs:
+                if isinstance(job, tuple):
+                    pending.append(pool.submit(job[0], *job[1]))
+                else:
+                    pending.append(job)
+
+                while pending and (
+                    not isinstance(pending[0], Future) or len(pending) > workers * 2
+                ):
+                    head = pending.popleft()
+                    yield head.result() if isinstance(head, Future) else head
+
+            for head in pending:
+                yield head.result() if isinstance(head, Future) else head
+
+
+class RawSource:
+    # byte spans of every section's lines in the decoded file, and what the
+    # section looked like back then. a section whose fingerprint still
+    # matches is copied out of the file instead of being formatted again
+    path: str
+    size: int
+    mtime: int
+    spans: dict[TAG_IDENTIFIER, list[list[int]]]
+    fingerprints: dict[TAG_IDENTIFIER, bytes]
+
+    def __init__(self, path: str):
+        stat = os.stat(path)
+        self.path = path
+        self.size = stat.st_size
+        self.mtime = stat.st_mtime_ns
+        self.spans = {}
+        self.fingerprints = {}
+
+    def addSpan(self, section: TAG_IDENTIFIER, start: int, end: int):
+        spans = self.spans.setdefault(section, [])
+
+        if spans and spans[-1][1] == start:
+            spans[-1][1] = end
+        else:
+            spans.append([start, end])
+
+    def extend(self, other: RawSource):
+        for section, spans in other.spans.items():
+            for start, end in spans:
+                self.addSpan(section, start, end)
+
+    def isCurrent(self) -> bool:
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return False
+
+        return stat.st_size == self.size and stat.st_mtime_ns == self.mtime
+
+    def readSection(self, section: TAG_IDENTIFIER) -> Iterator[bytes]:
+        if not (spans := self.spans.get(section)):
+            return
+
+        with open(self.path, "rb") as source:
+            with mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                for start, end in spans:
+                    for at in range(start, end, EXPORT_BUFFER_BYTES):
+                        yield mapped[at : min(end, at + EXPORT_BUFFER_BYTES)]
+
+                # the file's last line might not have had a newline
+                if mapped[spans[-1][1] - 1 : spans[-1][1]] != b"\n":
+                    yield b"\n"
+
+
+class ExportPiece(NamedTuple):
+    # one independently rewritable part of an exported file. `append` gives,
+    # for an older element count, the fingerprint those elements had and a
+    # renderer for everything after them
+    key: tuple
+    fingerprint: bytes
+    count: int
+    render: Callable[[], str]
+    append: Callable[[int], tuple[bytes, Callable[[], str]]] | None = None
+
+
+class WrittenPiece(NamedTuple):
+    key: tuple
+    fingerprint: bytes
+    count: int
+    start: int
+    end: int
+
+
+class ExportState:
+    # the layout of a file as exportIncremental() last left it, and the float
+    # format it was written with
+    size: int
+    mtime: int
+    pieces: list[WrittenPiece]
+    floatFormat: FLOAT_FORMAT
+    digits: int
+
+    def __init__(
+        self,
+        path: str,
+        pieces: list[WrittenPiece],
+        floatFormat: FLOAT_FORMAT,
+        digits: int,
+    ):
+        stat = os.stat(path)
+        self.size = stat.st_size
+        self.mtime = stat.st_mtime_ns
+        self.pieces = pieces
+        self.floatFormat = floatFormat
+        self.digits = digits
+
+    def isCurrent(self, path: str) -> bool:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+
+        return stat.st_size == self.size and stat.st_mtime_ns == self.mtime
 
 
 class WaveObj:
     name: str
     isSmoothShaded: bool
-    raw: list[str]
+    storage: STORAGE_MODE
+    # only kept by decode(keepRaw=True)
+    raw: RawSource | None
+    # per absolute path, what exportIncremental() wrote there
+    exportStates: dict[str, ExportState]
+    # lists with STORAGE_MODE.OBJECTS, AttributeViews over the arrays below
+    # with STORAGE_MODE.NUMPY
     verticies: list[Vertex]
     vertexNormals: list[VertexNormal]
     vertexTextures: list[VertexTexture]
+    # None unless STORAGE_MODE.NUMPY, (N, 3|4), (N, 3) and (N, 2|3)
+    positions: np.ndarray | None
+    normals: np.ndarray | None
+    uvs: np.ndarray | None
     parameterSpaceVertices: list[VertexParameterSpace]
-    linkedMTLLibs: list[str]
+    mtlLibs: SymbolList
     faces: FaceInformation
+    # names seen by decode(), one id space for the name, groups, materials
+    # and linkedMTLLibs
+    symbols: SymbolTable
+
+    @property
+    def linkedMTLLibs(self) -> SymbolList:
+        return self.mtlLibs
+
+    @linkedMTLLibs.setter
+    def linkedMTLLibs(self, names: Iterable[str]):
+        self.mtlLibs = SymbolList(self.symbols, names)
 
-    def __init__(self, name: str) -> None:
+    @property
+    def materialRuns(self) -> list[MaterialRun]:
+        return self.faces.materialRuns
+
+    @property
+    def materialNames(self) -> list[str]:
+        return self.faces.materialNames
+
+    def __init__(self, name: str, storage: STORAGE_MODE = STORAGE_MODE.OBJECTS) -> None:
         self.name = name
-        self.raw = []
+        self.storage = storage
+        self.raw = None
+        self.exportStates = {}
         self.verticies = []
         self.vertexNormals = []
         self.vertexTextures = []
+
+        if storage is STORAGE_MODE.NUMPY:
+            self.verticies = AttributeView(
+                self, "positions", VertexView, (0.0, 0.0, 0.0, 1.0)
+            )
+            self.vertexNormals = AttributeView(
+                self, "normals", VertexNormalView, (0.0, 0.0, 0.0)
+            )
+            self.vertexTextures = AttributeView(
+                self, "uvs", VertexTextureView, (0.0, 0.0, 0.0)
+            )
+
+        self.positions = None
+        self.normals = None
+        self.uvs = None
+
+        # empty, not None, so an object built up by hand still exports
+        if storage is STORAGE_MODE.NUMPY:
+            if np is None:
+                raise ImportError('storage="numpy" requires numpy to be installed')
+
+            self.positions = np.empty((0, 3))
+            self.normals = np.empty((0, 3))
+            self.uvs = np.empty((0, 2))
         self.parameterSpaceVertices = []
-        self.linkedMTLLibs = []
-        self.faces = FaceInformation()
+        self.symbols = SymbolTable()
+        self.mtlLibs = SymbolList(self.symbols)
+        self.faces = FaceInformation(self.symbols)
+
+    def formatSections(
+        self,
+        deterministic: bool = False,
+        workers: int | None = None,
+        floatFormat: FLOAT_FORMAT | str = FLOAT_FORMAT.FIXED,
+        digits: int = EXPORT_FLOAT_DIGITS,
+    ) -> Iterator[str | bytes]:
+        # sections copied out of a kept source file come as bytes.
+        # deterministic output has no timestamp and no negative zeros, so the
+        # same mesh always exports to the same bytes.
+        # with workers the float and face blocks are formatted on a process pool
+        jobs = self.sectionJobs(FLOAT_FORMAT(floatFormat), digits, deterministic)
+        yield from Formatters.runJobs(jobs, workers)
+
+    def sectionJobs(
+        self, floatFormat: FLOAT_FORMAT, digits: int, deterministic: bool = False
+    ) -> Iterator[str | bytes | FormatJob]:
+        if deterministic:
+            yield f"{EXPORT_HEADER}\n"
+        else:
+            yield f"{EXPORT_HEADER}# Exported at: {datetime.now()}\n\n"
+
+        # source text only stands in for what we would write ourselves when no
+        # particular output was asked for. float sections are reformatted for
+        # any other float format, every section for deterministic output
+        keepSource = not deterministic
+        keepFloats = keepSource and (
+            floatFormat is FLOAT_FORMAT.FIXED and digits == EXPORT_FLOAT_DIGITS
+        )
+
+        # mtllibs if any, then the object name
+        yield "".join(
+            f"{TAG_IDENTIFIER_TO_STRING[TAG_IDENTIFIER.MTL_LIB]} {mtl}\n"
+            for mtl in self.linkedMTLLibs
+        )
+        yield f"\n{TAG_IDENTIFIER_TO_STRING[TAG_IDENTIFIER.OBJECT]} {self.name}\n\n"
+
+        for tag in (
+            TAG_IDENTIFIER.VERTEX,
+            TAG_IDENTIFIER.VERTEX_TEXTURE,
+            TAG_IDENTIFIER.VERTEX_NORMAL,
+        ):
+            if keepFloats and (raw := self.rawSection(tag)) is not None:
+                yield from raw
+            else:
+                yield from Formatters.attributeSection(
+                    tag,
+                    Formatters.attributeTable(self, tag),
+                    floatFormat,
+                    digits,
+                    deterministic,
+                )
+
+            if tag is TAG_IDENTIFIER.VERTEX:
+                yield "\n"
+
+        # smooth shading if set
+        if hasattr(self, "isSmoothShaded"):
+            yield f"{TAG_IDENTIFIER_TO_STRING[TAG_IDENTIFIER.SMOOTH_SHADE]} {1 if self.isSmoothShaded else 0}\n"
+        yield "\n"
+
+        raw = None
+        if keepSource:
+            raw = self.rawSection(TAG_IDENTIFIER.POLYGONAL_FACE_ELEMENT)
+
+        if raw is not None:
+            yield from raw
+        else:
+            yield from Formatters.faceSection(self.faces)
+
+        yield "\n# EOF"
+
+    def exportPieces(self, floatFormat: FLOAT_FORMAT, digits: int) -> list[ExportPiece]:
+        # the same layout as formatSections(deterministic=True), cut into
+        # attribute blocks, the whole face section and the text in between
+        def text(key: tuple, value: str) -> ExportPiece:
+            fingerprint = hashlib.blake2b(value.encode(), digest_size=16).digest()
+            return ExportPiece(key, fingerprint, 0, lambda: value)
+
+        def attributeBlock(tag: TAG_IDENTIFIER, index: int, block) -> ExportPiece:
+            def append(count: int) -> tuple[bytes, Callable[[], str]]:
+                rest = block[count:]
+                return Formatters.blockFingerprint(block[:count]), partial(
+                    Formatters.attributeBlock, tag, rest, floatFormat, digits, True
+                )
 
-    def export(self, absoluteFilePath: str | pathlib.Path):
+            return ExportPiece(
+                (tag.value, index),
+                Formatters.blockFingerprint(block),
+                len(block),
+                partial(
+                    Formatters.attributeBlock, tag, block, floatFormat, digits, True
+                ),
+                append,
+            )
+
+        def renderFaces(firstFace: int) -> str:
+            jobs = Formatters.faceSection(self.faces, firstFace)
+            return "".join(Formatters.runJobs(jobs, None))
 
-        def floatBackDecAmount(number: float, amount: int = 6):
-            return f"{number:.{amount}f}"
+        def appendFaces(count: int) -> tuple[bytes, Callable[[], str]]:
+            return self.faces.fingerprint(count), partial(renderFaces, count)
 
+        mtlLibs = "".join(
+            f"{TAG_IDENTIFIER_TO_STRING[TAG_IDENTIFIER.MTL_LIB]} {mtl}\n"
+            for mtl in self.linkedMTLLibs
+        )
+        objectName = f"{TAG_IDENTIFIER_TO_STRING[TAG_IDENTIFIER.OBJECT]} {self.name}"
+        pieces = [text(("header",), f"{EXPORT_HEADER}\n{mtlLibs}\n{objectName}\n\n")]
+
+        for tag in (
+            TAG_IDENTIFIER.VERTEX,
+            TAG_IDENTIFIER.VERTEX_TEXTURE,
+            TAG_IDENTIFIER.VERTEX_NORMAL,
+        ):
+            table = Formatters.attributeTable(self, tag)
+
+            for index, start in enumerate(range(0, len(table), EXPORT_BLOCK_ROWS)):
+                block = table[start : start + EXPORT_BLOCK_ROWS]
+                pieces.append(attributeBlock(tag, index, block))
+
+            if tag is TAG_IDENTIFIER.VERTEX:
+                pieces.append(text(("gap",), "\n"))
+
+        smooth = ""
+        if hasattr(self, "isSmoothShaded"):
+            smooth = f"{TAG_IDENTIFIER_TO_STRING[TAG_IDENTIFIER.SMOOTH_SHADE]} {1 if self.isSmoothShaded else 0}\n"
+        pieces.append(text(("smooth",), f"{smooth}\n"))
+
+        faces = self.faces
+        pieces.append(
+            ExportPiece(
+                ("faces",),
+                faces.fingerprint(),
+                len(faces),
+                partial(renderFaces, 0),
+                appendFaces,
+            )
+        )
+        pieces.append(text(("eof",), "\n# EOF"))
+
+        return pieces
+
+    def exportIncremental(
+        self,
+        absoluteFilePath: str | pathlib.Path,
+        floatFormat: FLOAT_FORMAT | str = FLOAT_FORMAT.FIXED,
+        digits: int = EXPORT_FLOAT_DIGITS,
+    ) -> int:
+        # rewrites only what changed since the last exportIncremental() to the
+        # same path. changed pieces of the same length are patched in place,
+        # otherwise the file is rewritten from the first piece that moved, with
+        # unchanged pieces copied over and only appended elements formatted.
+        # the file always ends up equal to export(deterministic=True).
+        # returns how many bytes had to be formatted and written
         path = str(absoluteFilePath)
 
+        if isCompressed(path):
+            raise ValueError(f'"{path}" is compressed and can not be patched in place')
         if not path.endswith(".obj"):
             path = f"{path}.obj"
 
-        with open(path, "w") as file:
-            file.write("# Exported with WavefrontDOTpy\n")
-            file.write(f"# Exported at: {datetime.now()}\n")
-            file.write("\n")
+        def encode(render: Callable[[], str]) -> bytes:
+            return render().encode()
+
+        floatFormat = FLOAT_FORMAT(floatFormat)
+        pieces = self.exportPieces(floatFormat, digits)
+        stateKey = os.path.abspath(path)
+        state = self.exportStates.get(stateKey)
+        written: list[WrittenPiece] = []
+        writtenBytes = 0
+
+        # fingerprints only cover the data, another format is a full rewrite
+        if (
+            state is None
+            or not state.isCurrent(path)
+            or (state.floatFormat, state.digits) != (floatFormat, digits)
+        ):
+            with open(path, "wb", buffering=EXPORT_BUFFER_BYTES) as file:
+                for piece in pieces:
+                    data = encode(piece.render)
+                    start = file.tell()
+                    file.write(data)
+                    written.append(WrittenPiece(*piece[:3], start, start + len(data)))
+
+            self.exportStates[stateKey] = ExportState(
+                path, written, floatFormat, digits
+            )
+            return written[-1].end
+
+        old = state.pieces
+
+        with open(path, "r+b") as file:
+            index = 0
+
+            # leading pieces that kept their place
+            while index < min(len(pieces), len(old)):
+                piece, before = pieces[index], old[index]
+
+                if piece.key != before.key:
+                    break
+
+                if piece.fingerprint != before.fingerprint:
+                    data = encode(piece.render)
+
+                    if len(data) != before.end - before.start:
+                        break
+
+                    file.seek(before.start)
+                    file.write(data)
+                    writtenBytes += len(data)
+
+                written.append(WrittenPiece(*piece[:3], before.start, before.end))
+                index += 1
+
+            if index < len(pieces) or index < len(old):
+                tailStart = old[index].start if index < len(old) else state.size
+                oldByKey = {before.key: before for before in old[index:]}
+                position = tailStart
+
+                # the new tail is put together on the side since it reads from
+                # the part of the file it is about to replace
+                with tempfile.TemporaryFile() as tail:
+                    for piece in pieces[index:]:
+                        start = tail.tell()
+                        kept = 0
+                        appended = None
+
+                        if (before := oldByKey.get(piece.key)) is not None:
+                            if piece.fingerprint == before.fingerprint:
+                                kept = before.end - before.start
+                            elif (
+                                piece.append is not None and piece.count > before.count
+                            ):
+                                prefix, appended = piece.append(before.count)
+                                if prefix == before.fingerprint:
+                                    kept = before.end - before.start
+
+                        if kept:
+                            file.seek(before.start)
+
+                            for at in range(0, kept, EXPORT_BUFFER_BYTES):
+                                tail.write(
+                                    file.read(min(EXPORT_BUFFER_BYTES, kept - at))
+                                )
+
+                            if piece.fingerprint != before.fingerprint:
+                                tail.write(encode(appended))
+                        else:
+                            tail.write(encode(piece.render))
+
+                        length = tail.tell() - start
+                        writtenBytes += length - kept
+                        written.append(
+                            WrittenPiece(*piece[:3], position, position + length)
+                        )
+                        position += length
+
+                    tail.seek(0)
+                    file.seek(tailStart)
+                    shutil.copyfileobj(tail, file, EXPORT_BUFFER_BYTES)
+                    file.truncate()
 
-            # Write mtllibs if any
-            for mtl in self.linkedMTLLibs:
-                file.write(
-                    f"{TAG_IDENTIFIER_TO_STRING[TAG_IDENTIFIER.MTL_LIB]} {mtl}\n"
-                )
-            file.write("\n")
+        self.exportStates[stateKey] = ExportState(path, written, floatFormat, digits)
+        return writtenBytes
 
-            # Write object name
-            file.write(
-                f"{TAG_IDENTIFIER_TO_STRING[TAG_IDENTIFIER.OBJECT]} {self.name}\n"
+    def sectionFingerprint(self, section: TAG_IDENTIFIER) -> bytes:
+        digest = hashlib.blake2b(digest_size=16)
+
+        if section is not TAG_IDENTIFIER.POLYGONAL_FACE_ELEMENT:
+            table = Formatters.attributeTable(self, section)
+
+            if isinstance(table, list):
+                table = array("d", chain.from_iterable(table))
+            else:
+                digest.update(repr(table.shape).encode())
+                table = np.ascontiguousarray(table, dtype=np.float64)
+
+            digest.update(table)
+            return digest.digest()
+
+        return self.faces.fingerprint()
+
+    def rawSection(self, section: TAG_IDENTIFIER) -> Iterator[bytes] | None:
+        raw = self.raw
+
+        if raw is None or section not in raw.fingerprints or not raw.isCurrent():
+            return None
+        if raw.fingerprints[section] != self.sectionFingerprint(section):
+            return None
+
+        return raw.readSection(section)
+
+    def export(
+        self,
+        absoluteFilePath: str | pathlib.Path,
+        deterministic: bool = False,
+        workers: int | None = None,
+        floatFormat: FLOAT_FORMAT | str = FLOAT_FORMAT.FIXED,
+        digits: int = EXPORT_FLOAT_DIGITS,
+    ):
+        path = str(absoluteFilePath)
+        options = (deterministic, workers, floatFormat, digits)
+
+        # "mesh.obj.gz", "mesh.obj.bz2" and "mesh.obj.xz" are compressed on the fly
+        if isCompressed(path):
+            opener = COMPRESSION_OPENERS[pathlib.Path(path).suffix]
+
+            # gzip stamps the time and the file name into its own header
+            if deterministic and opener is gzip.open:
+                with (
+                    open(path, "wb") as target,
+                    gzip.GzipFile(
+                        filename="", fileobj=target, mode="wb", mtime=0
+                    ) as file,
+                ):
+                    self.exportTo(file, "utf-8", *options)
+                return
+
+            with opener(path, "wb") as file:
+                self.exportTo(file, "utf-8", *options)
+            return
+
+        if not path.endswith(".obj"):
+            path = f"{path}.obj"
+
+        with open(path, "wb", buffering=EXPORT_BUFFER_BYTES) as file:
+            self.exportTo(file, "utf-8", *options)
+
+    def exportBinary(self, absoluteFilePath: str | pathlib.Path):
+        # see Binary.py for the layout, read back with decodeBinary()
+        from WaveFrontDOTPy import Binary
+
+        meta, arrays = Binary.objectToArrays(self)
+        Binary.writeArrays(absoluteFilePath, meta, arrays)
+
+    def exportGLB(self, absoluteFilePath: str | pathlib.Path):
+        # glTF 2.0 binary, v/vt/vn triples are merged into one indexed vertex
+        # buffer and every material becomes a primitive. see GLTF.py
+        from WaveFrontDOTPy import GLTF
+
+        GLTF.writeGLB(self, absoluteFilePath)
+
+    def iterExport(
+        self,
+        encoding: str = "utf-8",
+        deterministic: bool = False,
+        workers: int | None = None,
+        floatFormat: FLOAT_FORMAT | str = FLOAT_FORMAT.FIXED,
+        digits: int = EXPORT_FLOAT_DIGITS,
+    ) -> Iterator[bytes]:
+        # small sections are coalesced so consumers see chunks of roughly
+        # EXPORT_BUFFER_BYTES instead of one per header line
+        pending: list[str] = []
+        pendingSize = 0
+
+        sections = self.formatSections(deterministic, workers, floatFormat, digits)
+
+        for section in sections:
+            # raw bytes from the source file go out as they are
+            if isinstance(section, bytes):
+                if pending:
+                    yield "".join(pending).encode(encoding)
+                    pending.clear()
+                    pendingSize = 0
+
+                yield section
+                continue
+
+            pending.append(section)
+            pendingSize += len(section)
+
+            if pendingSize >= EXPORT_BUFFER_BYTES:
+                yield "".join(pending).encode(encoding)
+                pending.clear()
+                pendingSize = 0
+
+        if pending:
+            yield "".join(pending).encode(encoding)
+
+    def exportTo(
+        self,
+        stream: IO,
+        encoding: str = "utf-8",
+        deterministic: bool = False,
+        workers: int | None = None,
+        floatFormat: FLOAT_FORMAT | str = FLOAT_FORMAT.FIXED,
+        digits: int = EXPORT_FLOAT_DIGITS,
+    ):
+        options = (deterministic, workers, floatFormat, digits)
+
+        # text streams get str, anything else (files opened "wb", gzip,
+        # sockets via makefile, response bodies) gets encoded bytes
+        if isinstance(stream, io.TextIOBase):
+            for section in self.formatSections(*options):
+                if isinstance(section, bytes):
+                    section = section.decode(encoding)
+
+                stream.write(section)
+            return
+
+        for chunk in self.iterExport(encoding, *options):
+            stream.write(chunk)
+
+
+class DecodeEvent(NamedTuple):
+    # value by tag:
+    #   OBJECT, GROUP, MTL_LIB, USE_MTL_LIB -> str
+    #   VERTEX, VERTEX_NORMAL, VERTEX_TEXTURE -> Vertex, VertexNormal, VertexTexture
+    #   POLYGONAL_FACE_ELEMENT -> list[VertexIndexer]
+    #   SMOOTH_SHADE -> bool
+    tag: TAG_IDENTIFIER
+    value: Any
+
+
+class DecodedChunk:
+    # what a worker sends back for its byte range of the file, None means
+    # the range never touched that piece of state
+    name: str | None
+    isSmoothShaded: bool | None
+    mtlLibs: SymbolList
+    positions: AttributeBuffer
+    normals: AttributeBuffer
+    uvs: AttributeBuffer
+    faces: FaceInformation
+    # corners resolved against the chunk's own counts, see absorbChunk()
+    relativeCorners: list[int]
+    raw: RawSource | None
+
+    def __init__(self, decoder: Decoder):
+        self.name = decoder.currentObject.name
+        self.isSmoothShaded = getattr(decoder.currentObject, "isSmoothShaded", None)
+        self.mtlLibs = decoder.currentObject.linkedMTLLibs
+        self.positions = decoder.positions
+        self.normals = decoder.normals
+        self.uvs = decoder.uvs
+        self.faces = decoder.currentObject.faces
+        self.relativeCorners = decoder.relativeCorners
+        self.raw = decoder.raw
+
+
+class Decoder:
+    currentObject: WaveObj
+    storage: STORAGE_MODE
+    precision: PRECISION
+    symbols: SymbolTable
+    # handlers get the split line and the line itself, names are sliced from it
+    handlers: dict[str | bytes, Callable[[list, str | bytes], None]]
+    # flat attribute buffers, only used with STORAGE_MODE.NUMPY or useBuffers()
+    positions: AttributeBuffer | None
+    normals: AttributeBuffer | None
+    uvs: AttributeBuffer | None
+    # spans of the mapped file's sections, only kept when asked for
+    raw: RawSource | None
+    # flat positions of corners that had relative (negative) indices
+    relativeCorners: list[int]
+
+    def __init__(
+        self,
+        name: str,
+        storage: STORAGE_MODE | str = STORAGE_MODE.OBJECTS,
+        precision: PRECISION | str = PRECISION.FLOAT64,
+    ) -> None:
+        self.storage = STORAGE_MODE(storage)
+        self.precision = PRECISION(precision)
+
+        if self.storage is STORAGE_MODE.NUMPY and np is None:
+            raise ImportError('storage="numpy" requires numpy to be installed')
+
+        if (
+            self.precision is not PRECISION.FLOAT64
+            and self.storage is not STORAGE_MODE.NUMPY
+        ):
+            raise ValueError(
+                f'precision="{self.precision.value}" requires storage="numpy"'
             )
-            file.write("\n")
-
-            # Write vertices
-            for v in self.verticies:
-                file.write(
-                    f"{TAG_IDENTIFIER_TO_STRING[TAG_IDENTIFIER.VERTEX]} {floatBackDecAmount(v.X)} {floatBackDecAmount(v.Y)} {floatBackDecAmount(v.Z)}"
-                    + (
-                        f" {floatBackDecAmount(v.W)}"
-                        if hasattr(v, "W") and v.W != 1.0
-                        else ""
-                    )
-                    + "\n"
-                )
-            file.write("\n")
 
-            # Write vertex textures
-            for vt in self.vertexTextures:
-                file.write(
-                    f"{TAG_IDENTIFIER_TO_STRING[TAG_IDENTIFIER.VERTEX_TEXTURE]} {floatBackDecAmount(vt.X)} {floatBackDecAmount(vt.Y)}\n"
-                )
+        self.currentObject = WaveObj(name, self.storage)
+        self.symbols = self.currentObject.symbols
+        self.positions = None
+        self.normals = None
+        self.uvs = None
+        self.raw = None
+        self.relativeCorners = []
+
+        # every line is split exactly once, the tokens go straight to the handler
+        self.handlers = {
+            "o": self.onObject,
+            "v": self.onVertex,
+            "vn": self.onVertexNormal,
+            "vt": self.onVertexTexture,
+            "s": self.onSmoothShade,
+            "mtllib": self.onMTLLib,
+            "usemtl": self.onUseMTL,
+            "f": self.onFace,
+            "g": self.onGroup,
+            "l": self.onUnsupported,
+            "vp": self.onUnsupported,
+        }
+
+        # lines read from a mapped file stay bytes all the way to the handler
+        self.handlers.update({k.encode(): v for k, v in self.handlers.items()})
+
+        if self.storage is STORAGE_MODE.NUMPY:
+            self.useBuffers()
+
+    def useBuffers(self):
+        self.positions = AttributeBuffer((0.0, 0.0, 0.0, 1.0), 3)
+        self.normals = AttributeBuffer((0.0, 0.0, 0.0), 3)
+        self.uvs = AttributeBuffer((0.0, 0.0, 0.0), 2)
+
+        for tag, buffer in (
+            ("v", self.positions),
+            ("vn", self.normals),
+            ("vt", self.uvs),
+        ):
+            self.handlers[tag] = self.handlers[tag.encode()] = buffer.appendTokens
+
+    def feedFile(self, path: str, start: int = 0, end: int | None = None):
+        with open(path, "rb") as target:
+            if os.fstat(target.fileno()).st_size == 0:
+                return
+
+            with mmap.mmap(target.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                self.feedMapped(mapped, start, len(mapped) if end is None else end)
+
+    def feedCompressed(self, path: str):
+        # decompressed windows are cut at their last newline, whatever is
+        # left over is carried into the next window
+        leftover = b""
+
+        with COMPRESSION_OPENERS[pathlib.Path(path).suffix](path, "rb") as source:
+            while chunk := source.read(COMPRESSED_READ_BYTES):
+                window = leftover + chunk
+                cut = window.rfind(b"\n") + 1
+                leftover = window[cut:]
+
+                if cut:
+                    self.feedMapped(window, 0, cut)
+
+        if leftover:
+            self.feedMapped(leftover, 0, len(leftover))
+
+    def feedMapped(self, mapped: mmap.mmap | bytes, start: int, end: int):
+        blocks: dict[bytes, Callable[[bytes, int], int]] = {}
+
+        if np is not None:
+            if self.positions is None:
+                self.useBuffers()
+
+            blocks = {
+                b"v": lambda block, lines: self.positions.appendBlock(
+                    block, lines, b"v"
+                ),
+                b"vn": lambda block, lines: self.normals.appendBlock(
+                    block, lines, b"vn"
+                ),
+                b"vt": lambda block, lines: self.uvs.appendBlock(block, lines, b"vt"),
+                b"f": self.onFaceBlock,
+            }
+
+        handlers = self.handlers
+        raw = self.raw
+        nextPosition = start
+
+        while (position := nextPosition) < end:
+            lineEnd = mapped.find(b"\n", position, end)
+            nextPosition = end if lineEnd < 0 else lineEnd + 1
+            line = mapped[position:nextPosition]
+            tokens = line.split()
+
+            if not tokens:
+                continue
+
+            tag = tokens[0]
+
+            # try to take the whole run of same-tag lines starting here in one go
+            if (appendBlock := blocks.get(tag)) is not None:
+                windowEnd = min(end, position + BLOCK_MAX_BYTES)
+                runEnd = BLOCK_ENDS[tag].search(mapped, position, windowEnd)
+
+                if runEnd is not None:
+                    runEnd = runEnd.end()
+                elif windowEnd == end:
+                    runEnd = end
+                else:
+                    runEnd = mapped.rfind(b"\n", position, windowEnd) + 1
 
-            # Write vertex normals
-            for vn in self.vertexNormals:
-                file.write(
-                    f"{TAG_IDENTIFIER_TO_STRING[TAG_IDENTIFIER.VERTEX_NORMAL]} {floatBackDecAmount(vn.X)} {floatBackDecAmount(vn.Y)} {floatBackDecAmount(vn.Z)}\n"
-                )
+                block = mapped[position:runEnd]
+                lines = block.count(b"\n") + (not block.endswith(b"\n"))
 
-            # Write smooth shading if set
-            if hasattr(self, "isSmoothShaded"):
-                file.write(
-                    f"{TAG_IDENTIFIER_TO_STRING[TAG_IDENTIFIER.SMOOTH_SHADE]} {1 if getattr(self, 'isSmoothShaded', False) else 0}\n"
-                )
-            file.write("\n")
+                if lines >= BLOCK_MIN_LINES:
+                    if (used := appendBlock(block, lines)) == 0:
+                        self.feedLines(block.splitlines())
+                        used = len(block)
+
+                    nextPosition = position + used
 
-            # Write faces
-            for face in self.faces.indexers:
-                if not face:
+                    if raw is not None:
+                        raw.addSpan(RAW_SECTIONS[tag], position, nextPosition)
                     continue
 
-                shaper = face[0]
-                shape = shaper.outputShape
+            if (handler := handlers.get(tag)) is None:
+                if TokenConsumers.isComment(tag):
+                    continue
 
-                if shaper.linkedMaterial is not None:
-                    file.write(
-                        f"{TAG_IDENTIFIER_TO_STRING[TAG_IDENTIFIER.USE_MTL_LIB]} {shaper.linkedMaterial}\n"
-                    )
+                raise UnknownTagException(TokenConsumers.asText(tag))
 
-                if shape == FACE_SHAPE_IDENTIFIER.VERTEX_AND_TEXTURE_AND_NORMAL:
-                    face_str = " ".join(
-                        f"{vi.vertexIndex}/{vi.vertexTextureIndex}/{vi.vertexNormalIndex}"
-                        for vi in face
-                    )
+            handler(tokens, line)
 
-                elif shape == FACE_SHAPE_IDENTIFIER.VERTEX_AND_TEXTURE:
-                    face_str = " ".join(
-                        f"{vi.vertexIndex}/{vi.vertexTextureIndex}" for vi in face
-                    )
-                elif shape == FACE_SHAPE_IDENTIFIER.VERTEX_AND_NORMAL:
-                    face_str = " ".join(
-                        f"{vi.vertexIndex}//{vi.vertexNormalIndex}" for vi in face
-                    )
-                elif shape == FACE_SHAPE_IDENTIFIER.VERTEX_ONLY:
-                    face_str = " ".join(f"{vi.vertexIndex}" for vi in face)
-                else:
-                    raise ShapeException(f'EXPORT ERROR\nShape "{shape}" unknown?!?!')
+            if raw is not None and (section := RAW_SECTIONS.get(tag)) is not None:
+                raw.addSpan(section, position, nextPosition)
 
-                file.write(
-                    f"{TAG_IDENTIFIER_TO_STRING[TAG_IDENTIFIER.POLYGONAL_FACE_ELEMENT]} {face_str}\n"
-                )
+    def absorbChunk(self, chunk: DecodedChunk):
+        # chunks have to be absorbed in file order. ids from other processes
+        # belong to their own tables, interning their names in chunk order
+        # first hands out the ids a single process would have
+        symbols = self.symbols
+        for name in chunk.faces.symbols.names:
+            symbols.intern(name)
+
+        if chunk.name is not None:
+            self.currentObject.name = symbols[symbols.intern(chunk.name)]
+        if chunk.isSmoothShaded is not None:
+            self.currentObject.isSmoothShaded = chunk.isSmoothShaded
+
+        self.currentObject.linkedMTLLibs.extend(chunk.mtlLibs)
+
+        # the chunk resolved relative indices against its own counts
+        if chunk.relativeCorners:
+            counts = self.attributeCounts()
+            corners = chunk.faces.corners
+            for position in chunk.relativeCorners:
+                corners[position] += counts[position % 3]
+
+        self.positions.extend(chunk.positions)
+        self.normals.extend(chunk.normals)
+        self.uvs.extend(chunk.uvs)
+        self.currentObject.faces.extendFaces(chunk.faces)
+
+        if self.raw is not None and chunk.raw is not None:
+            self.raw.extend(chunk.raw)
+
+    def feedLines(self, lines: Iterable[str] | Iterable[bytes]):
+        handlers = self.handlers
+
+        for line in lines:
+            tokens = line.split()
+
+            if not tokens:
+                continue
+
+            if (handler := handlers.get(tokens[0])) is None:
+                if TokenConsumers.isComment(tokens[0]):
+                    continue
+
+                raise UnknownTagException(TokenConsumers.asText(tokens[0]))
+
+            handler(tokens, line)
+
+    def finish(self) -> list[WaveObj]:
+        if self.storage is STORAGE_MODE.NUMPY:
+            dtype = self.precision.value
+            self.currentObject.positions = self.positions.toNumpy(dtype)
+            self.currentObject.normals = self.normals.toNumpy(dtype)
+            self.currentObject.uvs = self.uvs.toNumpy(dtype)
+
+        elif self.positions is not None:
+            self.currentObject.verticies = self.positions.toObjects(Vertex)
+            self.currentObject.vertexNormals = self.normals.toObjects(VertexNormal)
+            self.currentObject.vertexTextures = self.uvs.toObjects(VertexTexture)
+
+        if self.raw is not None:
+            for section in set(RAW_SECTIONS.values()):
+                fingerprint = self.currentObject.sectionFingerprint(section)
+                self.raw.fingerprints[section] = fingerprint
 
-            file.write("\n")
-            file.write("# EOF")
+            self.currentObject.raw = self.raw
+
+        return [self.currentObject]
+
+    def onObject(self, tokens: list[str] | list[bytes], line: str | bytes):
+        self.currentObject.name = self.symbols.nameOf(line)
+
+    def onVertex(self, tokens: list[str] | list[bytes], line: str | bytes):
+        self.currentObject.verticies.append(Vertex(*map(float, tokens[1:])))
+
+    def onVertexNormal(self, tokens: list[str] | list[bytes], line: str | bytes):
+        self.currentObject.vertexNormals.append(VertexNormal(*map(float, tokens[1:])))
+
+    def onVertexTexture(self, tokens: list[str] | list[bytes], line: str | bytes):
+        self.currentObject.vertexTextures.append(VertexTexture(*map(float, tokens[1:])))
+
+    def onSmoothShade(self, tokens: list[str] | list[bytes], line: str | bytes):
+        self.currentObject.isSmoothShaded = int(tokens[1]) == 1
+
+    def onGroup(self, tokens: list[str] | list[bytes], line: str | bytes):
+        # only interned, faces don't record their groups (Yet.)
+        self.symbols.internLine(line)
+
+    def onMTLLib(self, tokens: list[str] | list[bytes], line: str | bytes):
+        self.currentObject.linkedMTLLibs.appendId(self.symbols.internLine(line))
+
+    def onUseMTL(self, tokens: list[str] | list[bytes], line: str | bytes):
+        self.currentObject.faces.useSymbol(self.symbols.internLine(line))
+
+    def onFace(self, tokens: list[str] | list[bytes], line: str | bytes):
+        shape, corners = Parsers.Faces.cornersFromTokens(tokens)
+        faces = self.currentObject.faces
+        firstCorner = len(faces.corners)
+        faces.addFace(shape, corners)
+
+        if min(corners) < 0:
+            self.resolveRelative(firstCorner)
+
+    def onFaceBlock(self, block: bytes, lines: int) -> int:
+        faces = self.currentObject.faces
+        firstCorner = len(faces.corners)
+        used = faces.appendBlock(block, lines)
+
+        if used and block.find(b"-", 0, used) >= 0:
+            self.resolveRelative(firstCorner)
+
+        return used
+
+    def attributeCounts(self) -> tuple[int, int, int]:
+        # v, vt, vn read so far, in corner order
+        if self.positions is not None:
+            return len(self.positions), len(self.uvs), len(self.normals)
+
+        obj = self.currentObject
+        return len(obj.verticies), len(obj.vertexTextures), len(obj.vertexNormals)
+
+    def resolveRelative(self, firstCorner: int):
+        # relative indices only mean something while the file is being read,
+        # later v/vt/vn lines would shift them
+        faces = self.currentObject.faces
+        resolved = faces.resolveRelative(firstCorner, self.attributeCounts())
+        self.relativeCorners.extend(resolved)
+
+    def onUnsupported(self, tokens: list[str] | list[bytes], line: str | bytes):
+        pass
 
 
 ######## END-Classes
 ######## START-Methods
 
 
-def readFileLines(path: str) -> list[str]:
-    lines: list[str] | None = None
-    with open(path) as target:
-        lines = target.readlines()
+def splitFileRanges(path: str, count: int) -> list[tuple[int, int]]:
+    # `count` byte ranges of roughly the same size, each ending on a newline
+    size = os.path.getsize(path)
+    if size == 0:
+        return []
+
+    bounds = [0]
+    with open(path, "rb") as target:
+        with mmap.mmap(target.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            for i in range(1, count):
+                newline = mapped.find(b"\n", max(bounds[-1], size * i // count))
+                if newline == -1:
+                    break
+
+                bounds.append(newline + 1)
+
+    if bounds[-1] != size:
+        bounds.append(size)
+
+    return list(zip(bounds, bounds[1:]))
 
-    return lines
 
+def decodeFileRange(
+    path: str, start: int, end: int, keepRaw: bool = False
+) -> DecodedChunk:
+    decoder = Decoder(None)  # type: ignore
+    decoder.useBuffers()
 
-def getLines(source: str | pathlib.Path):
-    lines: list[str] | None = None
+    if keepRaw:
+        decoder.raw = RawSource(path)
+    decoder.feedFile(path, start, end)
+
+    return DecodedChunk(decoder)
+
+
+def readFileLines(path: str) -> Iterator[bytes]:
+    # the file is mapped instead of read, lines stay bytes (no text decoding)
+    # and the pages are shared with every other process reading the same file
+    with open(path, "rb") as target:
+        if os.fstat(target.fileno()).st_size == 0:
+            return
+
+        with mmap.mmap(target.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield from iter(mapped.readline, b"")
+
+
+def readCompressedLines(path: str) -> Iterator[bytes]:
+    with COMPRESSION_OPENERS[pathlib.Path(path).suffix](path, "rb") as source:
+        yield from source
+
+
+def isCompressed(path: str | pathlib.Path) -> bool:
+    return pathlib.Path(path).suffix in COMPRESSION_OPENERS
+
+
+def objectNameFor(path: pathlib.Path) -> str:
+    # "mesh.obj.gz" is still called "mesh"
+    if isCompressed(path):
+        path = path.with_suffix("")
+
+    return path.stem
+
+
+def getLines(source: str | pathlib.Path) -> Iterable[str] | Iterable[bytes]:
+    lines: Iterable[str] | Iterable[bytes] | None = None
 
     if isinstance(source, pathlib.Path):
         if not os.path.exists(source):
             raise FileNotFoundError(f'Failed to find file using path "{source}"')
 
-        lines = readFileLines(str(source))
+        if isCompressed(source):
+            lines = readCompressedLines(str(source))
+        else:
+            lines = readFileLines(str(source))
 
     elif isinstance(source, str):
         lines = source.splitlines()
@@ -461,97 +2530,151 @@ def getLines(source: str | pathlib.Path):
     return lines
 
 
-def decode(sourcePath: str | pathlib.Path):
-    lines = getLines(sourcePath)
-    lines = [
-        line
-        for line in lines
-        if not line.startswith("#") and line.strip() != "" and line.strip() != "\n"
-    ]
-
-    objects: list[WaveObj] = []
-    mtlLibs: list[str] = []
+def decode(
+    sourcePath: str | pathlib.Path,
+    storage: STORAGE_MODE | str = STORAGE_MODE.OBJECTS,
+    workers: int | None = None,
+    cache: bool | str | pathlib.Path = False,
+    cacheHash: bool = False,
+    keepRaw: bool = False,
+    precision: PRECISION | str = PRECISION.FLOAT64,
+):
+    # cache=True keeps a parsed copy next to the file, a folder path keeps
+    # them there instead. cacheHash keys the cache on content over mtime.
+    # precision="float32" halves the attribute arrays of storage="numpy"
+    cachePath: pathlib.Path | None = None
+
+    if cache and isinstance(sourcePath, pathlib.Path) and sourcePath.exists():
+        from WaveFrontDOTPy import Cache
+
+        cachePath = Cache.cachePathFor(sourcePath, cache)
+        cacheKey = Cache.cacheKey(sourcePath, cacheHash)
+        cacheKey["precision"] = PRECISION(precision).value
+
+        # cached objects don't carry source spans, keepRaw always decodes
+        cached = None if keepRaw else Cache.readCache(cachePath, cacheKey, storage)
+        if cached is not None:
+            return [cached]
 
     if isinstance(sourcePath, pathlib.Path):
-        currentObject: WaveObj | None = WaveObj(sourcePath.stem)
+        decoder = Decoder(objectNameFor(sourcePath), storage, precision)
+    else:
+        decoder = Decoder("object", storage, precision)
+
+    # keepRaw remembers where every section's lines sit in the file so an
+    # unchanged section can be exported by copying those bytes. plain files only
+    if keepRaw and isinstance(sourcePath, pathlib.Path) and sourcePath.exists():
+        if not isCompressed(sourcePath):
+            decoder.raw = RawSource(str(sourcePath))
+
+    # only plain files can be split up, source strings and compressed files
+    # are always decoded in-process
+    if (
+        workers is not None
+        and workers > 1
+        and isinstance(sourcePath, pathlib.Path)
+        and not isCompressed(sourcePath)
+    ):
+        if not os.path.exists(sourcePath):
+            raise FileNotFoundError(f'Failed to find file using path "{sourcePath}"')
+
+        path = str(sourcePath)
+        ranges = splitFileRanges(path, workers)
+        decoder.useBuffers()
+
+        with ProcessPoolExecutor(workers) as pool:
+            chunks = pool.map(
+                decodeFileRange,
+                [path] * len(ranges),
+                [start for start, _ in ranges],
+                [end for _, end in ranges],
+                [decoder.raw is not None] * len(ranges),
+            )
+
+            for chunk in chunks:
+                decoder.absorbChunk(chunk)
+
+    elif isinstance(sourcePath, pathlib.Path):
+        if not os.path.exists(sourcePath):
+            raise FileNotFoundError(f'Failed to find file using path "{sourcePath}"')
+
+        if isCompressed(sourcePath):
+            decoder.feedCompressed(str(sourcePath))
+        else:
+            decoder.feedFile(str(sourcePath))
+
     else:
-        currentObject: WaveObj | None = WaveObj("object")
+        decoder.feedLines(getLines(sourcePath))
 
+    objects = decoder.finish()
+
+    if cachePath is not None:
+        Cache.writeCache(cachePath, cacheKey, objects[0])
+
+    return objects
+
+
+def decodeBinary(
+    sourcePath: str | pathlib.Path,
+    storage: STORAGE_MODE | str = STORAGE_MODE.NUMPY,
+) -> WaveObj:
+    # the file is mapped, not read. with numpy storage the attribute arrays and
+    # face buffers are views into that mapping and nothing is copied up front
+    from WaveFrontDOTPy import Binary
+
+    meta, arrays = Binary.readArrays(sourcePath)
+    return Binary.objectFromArrays(meta, arrays, storage)
+
+
+def iterDecode(sourcePath: str | pathlib.Path) -> Iterator[DecodeEvent]:
+    # yields one event per element as the file is read, nothing is kept
+    # around besides the material that is currently in use and the names seen
     lastUsedMaterial: str | None = None
+    symbols = SymbolTable()
+
+    for line in getLines(sourcePath):
+        tokens = line.split()
 
-    for line in lines:
-        line = line.strip()
-        tagType: TAG_IDENTIFIER = TokenConsumers.consumeAndReturnTag(line)
+        if not tokens or TokenConsumers.isComment(tokens[0]):
+            continue
 
-        match tagType:
-            case TAG_IDENTIFIER.OBJECT:
-                assert currentObject is not None, "Master Object Unbound!"
-                name = TokenConsumers.consumeTagAndReturnLeftover(line)
-                currentObject.name = name
+        tags = (
+            TAG_IDENTIFIER_BYTES
+            if isinstance(line, bytes)
+            else TAG_IDENTIFIER_CHARACTERS
+        )
+
+        if (tag := tags.get(tokens[0])) is None:
+            raise UnknownTagException(TokenConsumers.asText(tokens[0]))
 
+        match tag:
             case TAG_IDENTIFIER.VERTEX:
-                assert currentObject is not None, "Master Object Unbound!"
-                vertex = Parsers.vertexOnlyParser(line)
-                currentObject.verticies.append(vertex)
+                yield DecodeEvent(tag, Vertex(*map(float, tokens[1:])))
 
             case TAG_IDENTIFIER.VERTEX_NORMAL:
-                assert currentObject is not None, "Master Object Unbound!"
-                vertexNormal = Parsers.vertexNormalParser(line)
-                currentObject.vertexNormals.append(vertexNormal)
+                yield DecodeEvent(tag, VertexNormal(*map(float, tokens[1:])))
 
             case TAG_IDENTIFIER.VERTEX_TEXTURE:
-                assert currentObject is not None, "Master Object Unbound!"
-                vertexTexture = Parsers.vertexTextureParser(line)
-                currentObject.vertexTextures.append(vertexTexture)
-
-            case TAG_IDENTIFIER.SMOOTH_SHADE:
-                assert currentObject is not None, "Master Object Unbound!"
-                raw = TokenConsumers.consumeTagAndReturnLeftover(line)
-                currentObject.isSmoothShaded = int(raw) == 1
-
-            case TAG_IDENTIFIER.MTL_LIB:
-                libName = TokenConsumers.consumeTagAndReturnLeftover(line)
-                mtlLibs.append(libName)
-
-            case TAG_IDENTIFIER.USE_MTL_LIB:
-                libName = TokenConsumers.consumeTagAndReturnLeftover(line)
-                lastUsedMaterial = libName
+                yield DecodeEvent(tag, VertexTexture(*map(float, tokens[1:])))
 
             case TAG_IDENTIFIER.POLYGONAL_FACE_ELEMENT:
-                assert currentObject is not None, "Master Object Unbound!"
-                dataType = Parsers.getFaceDataStyle(line)
-
-                match dataType:
-                    case FACE_SHAPE_IDENTIFIER.VERTEX_AND_TEXTURE_AND_NORMAL:
-                        indexers = Parsers.Faces.vertexTextureNormalParser(line)
-                    case FACE_SHAPE_IDENTIFIER.VERTEX_AND_TEXTURE:
-                        indexers = Parsers.Faces.vertexTextureParser(line)
-                    case FACE_SHAPE_IDENTIFIER.VERTEX_AND_NORMAL:
-                        indexers = Parsers.Faces.vertexAndNormalParser(line)
-                    case FACE_SHAPE_IDENTIFIER.VERTEX_ONLY:
-                        indexers = Parsers.Faces.vertexOnlyParser(line)
-                    case _:
-                        raise NotImplementedError(
-                            """CURRENTLY IMPLEMENTED: 
-FACE_SHAPE_IDENTIFIER.VERTEX_AND_TEXTURE_AND_NORMAL,
-FACE_SHAPE_IDENTIFIER.VERTEX_AND_TEXTURE,
-FACE_SHAPE_IDENTIFIER.VERTEX_AND_NORMAL"""
-                        )
+                indexers = Parsers.Faces.fromTokens(tokens)
 
                 if lastUsedMaterial is not None:
-
                     for indexer in indexers:
                         indexer.linkedMaterial = lastUsedMaterial
 
-                currentObject.faces.indexers.append(indexers)
+                yield DecodeEvent(tag, indexers)
 
-    if currentObject is not None:
-        objects.append(currentObject)
+            case TAG_IDENTIFIER.USE_MTL_LIB:
+                lastUsedMaterial = symbols.nameOf(line)
+                yield DecodeEvent(tag, lastUsedMaterial)
 
-    for object in objects:
-        object.linkedMTLLibs = mtlLibs
+            case TAG_IDENTIFIER.SMOOTH_SHADE:
+                yield DecodeEvent(tag, int(tokens[1]) == 1)
 
-    return objects
+            case TAG_IDENTIFIER.OBJECT | TAG_IDENTIFIER.GROUP | TAG_IDENTIFIER.MTL_LIB:
+                yield DecodeEvent(tag, symbols.nameOf(line))
 
 
 ######## END-Methods
@@ -0,0 +1,116 @@
+import pathlib
+import sys
+import timeit
+import tracemalloc
+
+from WaveFrontDOTPy.Object import (
+    decode,
+    Vertex,
+    VertexIndexer,
+    VertexNormal,
+    VertexTexture,
+)
+
+###
+
+# the element classes as they were before __slots__, one __dict__ per instance
+
+
+class DictVertex:
+    def __init__(self, X, Y, Z, W=1.0) -> None:
+        self.X = X
+        self.Y = Y
+        self.Z = Z
+        self.W = W
+
+
+class DictVertexNormal:
+    def __init__(self, X, Y, Z) -> None:
+        self.X = X
+        self.Y = Y
+        self.Z = Z
+
+
+class DictVertexTexture:
+    def __init__(self, X, Y, W=0.0) -> None:
+        self.X = X
+        self.Y = Y
+        self.W = W
+
+
+class DictVertexIndexer:
+    def __init__(self, vertexIndex, vertexTextureIndex, vertexNormalIndex):
+        self.vertexIndex = vertexIndex
+        self.vertexTextureIndex = vertexTextureIndex
+        self.vertexNormalIndex = vertexNormalIndex
+        self.linkedMaterial = None
+
+
+WUSON_PATH = pathlib.Path(__file__).parent / "object" / "WusonOBJ.obj"
+REPEATS = 5
+
+
+def elementRows(path: pathlib.Path) -> dict[str, list[tuple]]:
+    # the same rows decode() feeds the element constructors with
+    obj = decode(path)[0]
+
+    return {
+        "v": [(v.X, v.Y, v.Z, v.W) for v in obj.verticies],
+        "vn": [(vn.X, vn.Y, vn.Z) for vn in obj.vertexNormals],
+        "vt": [(vt.X, vt.Y, vt.W) for vt in obj.vertexTextures],
+        "f": [
+            (i.vertexIndex, i.vertexTextureIndex, i.vertexNormalIndex)
+            for face in obj.faces.indexers
+            for i in face
+        ],
+    }
+
+
+def build(classes: dict[str, type], rows: dict[str, list[tuple]]) -> list:
+    return [[factory(*row) for row in rows[tag]] for tag, factory in classes.items()]
+
+
+def measure(
+    classes: dict[str, type], rows: dict[str, list[tuple]]
+) -> tuple[int, float]:
+    tracemalloc.start()
+    elements = build(classes, rows)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del elements
+
+    seconds = min(timeit.repeat(lambda: build(classes, rows), number=1, repeat=REPEATS))
+    return size, seconds
+
+
+def main(path: pathlib.Path = WUSON_PATH):
+    rows = elementRows(path)
+    counts = ", ".join(f"{len(values)} {tag}" for tag, values in rows.items())
+    print(f"{path.name}: {counts}")
+
+    results = {
+        "dict": measure(
+            {
+                "v": DictVertex,
+                "vn": DictVertexNormal,
+                "vt": DictVertexTexture,
+                "f": DictVertexIndexer,
+            },
+            rows,
+        ),
+        "slots": measure(
+            {"v": Vertex, "vn": VertexNormal, "vt": VertexTexture, "f": VertexIndexer},
+            rows,
+        ),
+    }
+
+    for name, (size, seconds) in results.items():
+        print(f"{name:>6}: {size / 1024:8.0f} KiB {seconds * 1000:8.1f} ms")
+
+    (dictSize, dictTime), (slotSize, slotTime) = results.values()
+    print(f"memory x{dictSize / slotSize:.2f}, construction x{dictTime / slotTime:.2f}")
+    print(f"python {sys.version.split()[0]}")
+
+
+if __name__ == "__main__":
+    main(pathlib.Path(sys.argv[1]) if len(sys.argv) > 1 else WUSON_PATH)
@@ -2,13 +2,34 @@
 # Generated At: 2025-12-11 22:19:08.122714
 # Author: Zane Reisbig
 
+import gzip
+import io
+import os
 import unittest
 import pathlib
+import tempfile
 from time import sleep
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 ###
 from WaveFrontDOTPy import WaveObj, TokenConsumers, UnknownTagException
-from WaveFrontDOTPy.Object import decode
+from WaveFrontDOTPy.Object import (
+    decode,
+    decodeBinary,
+    iterDecode,
+    FACE_SHAPE_IDENTIFIER,
+    FLOAT_FORMAT,
+    STORAGE_MODE,
+    TAG_IDENTIFIER,
+    ShapeException,
+    Vertex,
+    VertexNormal,
+    VertexTexture,
+)
 
 ###
 
@@ -38,6 +59,15 @@ def getTestObjFile():
     return lines
 
 
+def slotValues(element) -> dict:
+    # vars() for the slotted element classes, unset slots are left out
+    return {
+        name: getattr(element, name)
+        for name in type(element).__slots__
+        if hasattr(element, name)
+    }
+
+
 class All(unittest.TestCase):
 
     def test_canGetRawObjFile(self):
@@ -74,3 +104,783 @@ class All(unittest.TestCase):
         self.assertGreater(len(objects), 0)
 
         objects[0].export(OUT_FILE_PATH)
+
+    def test_decodeTokenizesEachLineOnce(self):
+        source = "\n".join(
+            [
+                "# comment",
+                "o  spaced   name ",
+                "v 0.1  0.2 0.3",
+                "v 1 2 3 0.5",
+                "vn 0 0 1",
+                "usemtl  Hard  Shiny Plastic White ",
+                "f 1//1  2//1 1//1",
+            ]
+        )
+        obj = decode(source)[0]
+
+        # names keep their inner spacing, a usemtl has to match its newmtl
+        self.assertEqual(obj.name, "spaced   name")
+        self.assertEqual(len(obj.verticies), 2)
+        self.assertEqual(obj.verticies[1].W, 0.5)
+        face = obj.faces.indexers[0]
+        self.assertEqual([i.vertexIndex for i in face], [1, 2, 1])
+        self.assertEqual(face[0].linkedMaterial, "Hard  Shiny Plastic White")
+
+        with self.assertRaises(UnknownTagException):
+            decode("v 0 0 0\nbogus 1 2")
+
+    @unittest.skipIf(np is None, "numpy not installed")
+    def test_numpyStorageMatchesObjects(self):
+        wuson = pathlib.Path(OBJECT_FOLDER_PATH, "WusonOBJ.obj")
+        objects = decode(wuson)[0]
+        arrays = decode(wuson, storage="numpy")[0]
+
+        self.assertEqual(arrays.positions.shape, (len(objects.verticies), 3))
+        self.assertEqual(arrays.normals.shape, (len(objects.vertexNormals), 3))
+        self.assertEqual(arrays.uvs.shape[0], len(objects.vertexTextures))
+        self.assertEqual(arrays.positions.dtype, np.float64)
+        self.assertEqual(
+            arrays.positions.tolist(),
+            [[v.X, v.Y, v.Z] for v in objects.verticies],
+        )
+        # nothing is materialised, the element lists are views
+        self.assertNotIsInstance(arrays.verticies, list)
+
+        with tempfile.TemporaryDirectory() as folder:
+            objects.export(pathlib.Path(folder, "objects"))
+            arrays.export(pathlib.Path(folder, "arrays"))
+
+            # only the timestamp line may differ
+            a = pathlib.Path(folder, "objects.obj").read_text().splitlines()[2:]
+            b = pathlib.Path(folder, "arrays.obj").read_text().splitlines()[2:]
+            self.assertEqual(a, b)
+
+    def test_facesAreStoredAsFlatBuffers(self):
+        obj = decode("v 0 0 0\nvt 0 0\nvn 0 0 1\nf 1/1/1 1/1/1 1/1/1 1/1/1\nf 1 1 1")[0]
+        faces = obj.faces
+
+        self.assertEqual(faces.corners.itemsize, 2)
+        self.assertEqual(list(faces.offsets), [0, 4, 7])
+        self.assertEqual(list(faces.corners[12:]), [1, 0, 0] * 3)
+        self.assertEqual(len(faces.indexers), 2)
+        self.assertEqual(
+            faces.indexers[-1][0].outputShape, FACE_SHAPE_IDENTIFIER.VERTEX_ONLY
+        )
+
+        faces.indexers.append(faces.indexers[0])
+        self.assertEqual(list(faces.offsets), [0, 4, 7, 11])
+        self.assertEqual(faces.corners[-3:].tolist(), [1, 1, 1])
+
+    def test_materialsAreStoredAsRuns(self):
+        obj = decode(pathlib.Path(OBJECT_FOLDER_PATH, "Many_Materials.obj"))[0]
+
+        self.assertEqual(obj.materialNames, ["mtl3", "mtl", "mtl2"])
+        self.assertEqual(
+            [
+                (obj.symbols[r.materialId], r.firstFace, r.faceCount)
+                for r in obj.materialRuns
+            ],
+            [("mtl3", 0, 2), ("mtl", 2, 3), ("mtl2", 5, 4), ("mtl", 9, 3)],
+        )
+        self.assertEqual(obj.faces.indexers[4][0].linkedMaterial, "mtl")
+
+        # unknown materials aren't interned on the way to the KeyError
+        names = list(obj.symbols.names)
+        with self.assertRaises(KeyError):
+            obj.faces.renameMaterial("doesnotexist", "q")
+        self.assertEqual(obj.symbols.names, names)
+
+        obj.faces.renameMaterial("mtl", "renamed")
+        self.assertEqual(obj.materialNames, ["mtl3", "renamed", "mtl2"])
+
+        with tempfile.TemporaryDirectory() as folder:
+            obj.export(pathlib.Path(folder, "out"))
+            text = pathlib.Path(folder, "out.obj").read_text()
+
+        self.assertEqual(text.count("\nusemtl "), 4)
+
+    def test_iterDecodeStreamsEvents(self):
+        events = iterDecode(pathlib.Path(OBJECT_FOLDER_PATH, "Many_Materials.obj"))
+        self.assertFalse(isinstance(events, list))
+
+        counts: dict[TAG_IDENTIFIER, int] = {}
+        lastFace = None
+        for event in events:
+            counts[event.tag] = counts.get(event.tag, 0) + 1
+            if event.tag is TAG_IDENTIFIER.POLYGONAL_FACE_ELEMENT:
+                lastFace = event.value
+
+        self.assertEqual(counts[TAG_IDENTIFIER.VERTEX], 8)
+        self.assertEqual(counts[TAG_IDENTIFIER.VERTEX_NORMAL], 6)
+        self.assertEqual(counts[TAG_IDENTIFIER.POLYGONAL_FACE_ELEMENT], 12)
+        self.assertEqual(counts[TAG_IDENTIFIER.USE_MTL_LIB], 12)
+        self.assertEqual(lastFace[0].linkedMaterial, "mtl")
+
+    def test_fileLinesAreMappedBytes(self):
+        from WaveFrontDOTPy.Object import readFileLines
+
+        with tempfile.TemporaryDirectory() as folder:
+            path = pathlib.Path(folder, "crlf.obj")
+            path.write_bytes(
+                b"o caf\xc3\xa9\r\nv 1 2 3\r\n#c\r\nusemtl a b\r\nf 1 1 1\r\n"
+            )
+
+            lines = list(readFileLines(str(path)))
+            self.assertIsInstance(lines[0], bytes)
+
+            obj = decode(path)[0]
+            self.assertEqual(obj.name, "café")
+            self.assertEqual(obj.verticies[0].Z, 3.0)
+            self.assertEqual(obj.faces.indexers[0][0].linkedMaterial, "a b")
+
+            pathlib.Path(folder, "empty.obj").write_bytes(b"")
+            self.assertEqual(len(decode(pathlib.Path(folder, "empty.obj"))), 1)
+
+    def test_parallelDecodeMatchesSequential(self):
+        path = pathlib.Path(OBJECT_FOLDER_PATH, "Many_Materials.obj")
+        sequential = decode(path)[0]
+
+        # more workers than needed so material runs get cut across chunks
+        for workers in (2, 5):
+            parallel = decode(path, workers=workers)[0]
+
+            self.assertEqual(parallel.name, sequential.name)
+            self.assertEqual(parallel.linkedMTLLibs, sequential.linkedMTLLibs)
+            self.assertEqual(
+                [(v.X, v.Y, v.Z) for v in parallel.verticies],
+                [(v.X, v.Y, v.Z) for v in sequential.verticies],
+            )
+            self.assertEqual(parallel.faces.corners, sequential.faces.corners)
+            self.assertEqual(parallel.faces.offsets, sequential.faces.offsets)
+            self.assertEqual(
+                [vars(run) for run in parallel.materialRuns],
+                [vars(run) for run in sequential.materialRuns],
+            )
+
+        # names spread over every chunk get the same ids as in one process
+        text = "mtllib a.mtl\no first\nv 0 0 0\n" + "".join(
+            f"g part{i}\nusemtl m{i % 3}\nf 1 1 1\nf 1 1 1\nmtllib b{i % 2}.mtl\n"
+            for i in range(20)
+        )
+
+        with tempfile.TemporaryDirectory() as folder:
+            path = pathlib.Path(folder, "names.obj")
+            path.write_text(text)
+            sequential = decode(path)[0]
+
+            for workers in (2, 5):
+                parallel = decode(path, workers=workers)[0]
+
+                self.assertEqual(parallel.name, "first")
+                self.assertEqual(parallel.symbols.names, sequential.symbols.names)
+                self.assertEqual(
+                    parallel.linkedMTLLibs.ids, sequential.linkedMTLLibs.ids
+                )
+                self.assertEqual(
+                    [vars(run) for run in parallel.materialRuns],
+                    [vars(run) for run in sequential.materialRuns],
+                )
+
+    @unittest.skipIf(np is None, "numpy not installed")
+    def test_vertexBlocksMatchLineParsing(self):
+        lines = [f"v {i}.5 {i}.25 -{i}" for i in range(20)]
+        lines += ["vt 0.5 0.5"] * 3 + ["vn 0 0 1"] * 12
+        # mixed component counts inside one run go line by line
+        lines += [f"v 1 2 3{' 0.5' if i % 2 else ''}" for i in range(10)]
+        lines += [f"vt 0.{i} 0.{i}\t0.{i}" for i in range(10)]
+        source = "\n".join(lines)
+
+        with tempfile.TemporaryDirectory() as folder:
+            path = pathlib.Path(folder, "blocks.obj")
+            path.write_text(source)
+
+            for storage in ("numpy", "objects"):
+                fromFile = decode(path, storage=storage)[0]
+                fromLines = decode(source, storage=storage)[0]
+
+                if storage == "numpy":
+                    self.assertEqual(fromFile.positions.shape, (30, 4))
+                    self.assertTrue((fromFile.positions == fromLines.positions).all())
+                    self.assertTrue((fromFile.normals == fromLines.normals).all())
+                    self.assertTrue((fromFile.uvs == fromLines.uvs).all())
+                else:
+                    self.assertEqual(
+                        [slotValues(v) for v in fromFile.verticies],
+                        [slotValues(v) for v in fromLines.verticies],
+                    )
+
+    @unittest.skipIf(np is None, "numpy not installed")
+    def test_faceBlocksMatchLineParsing(self):
+        lines = ["v 0 0 0"] * 4 + ["vt 0 0"] * 2 + ["vn 0 0 1"] * 2
+        lines += ["usemtl a"]
+        # triangles and quads mixed inside one run
+        lines += [
+            f"f {i % 3 + 1}//1 2//2 3//1" + (" 4//2" * (i % 2)) for i in range(12)
+        ]
+        # shape changes mid-run, the rest of the run is cut into its own block
+        lines += [f"f 1/1/1 2/2/2 -1/-1/-1" for _ in range(10)]
+        lines += ["usemtl b"] + [f"f 1 2 3 4" for _ in range(9)] + ["f 1/2 2/1 3/2"]
+        source = "\n".join(lines)
+
+        with tempfile.TemporaryDirectory() as folder:
+            path = pathlib.Path(folder, "faces.obj")
+            path.write_text(source)
+
+            fromFile = decode(path, storage="numpy")[0].faces
+            fromLines = decode(source, storage="numpy")[0].faces
+
+        self.assertEqual(len(fromFile), 32)
+        self.assertEqual(fromFile.corners, fromLines.corners)
+        self.assertEqual(fromFile.offsets, fromLines.offsets)
+        self.assertEqual(fromFile.shapes, fromLines.shapes)
+        self.assertEqual(
+            [vars(run) for run in fromFile.materialRuns],
+            [vars(run) for run in fromLines.materialRuns],
+        )
+
+    @unittest.skipIf(np is None, "numpy not installed")
+    def test_decodeCacheRoundTrips(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path = pathlib.Path(folder, "cube.obj")
+            path.write_text(TEST_CASE_PATH.read_text())
+
+            fresh = decode(path)[0]
+            first = decode(path, cache=folder)[0]
+            cacheFiles = list(pathlib.Path(folder).glob("*.objcache"))
+            self.assertEqual(len(cacheFiles), 1)
+
+            for storage in ("objects", "numpy"):
+                cached = decode(path, storage=storage, cache=folder)[0]
+                self.assertEqual(cached.linkedMTLLibs, fresh.linkedMTLLibs)
+                self.assertEqual(cached.faces.corners, fresh.faces.corners)
+                self.assertEqual(
+                    [vars(run) for run in cached.faces.materialRuns],
+                    [vars(run) for run in fresh.faces.materialRuns],
+                )
+
+            self.assertEqual(
+                [slotValues(v) for v in cached.faces.indexers[0]],
+                [slotValues(v) for v in first.faces.indexers[0]],
+            )
+
+            # an edited file misses the cache and rewrites it
+            path.write_text(TEST_CASE_PATH.read_text() + "v 9 9 9\n")
+            edited = decode(path, cache=folder)[0]
+            self.assertEqual(len(edited.verticies), len(fresh.verticies) + 1)
+            self.assertEqual(
+                len(decode(path, storage="numpy", cache=folder)[0].positions),
+                len(fresh.verticies) + 1,
+            )
+
+    @unittest.skipIf(np is None, "numpy not installed")
+    def test_hashedCacheFollowsCopies(self):
+        import shutil
+
+        # cached faces come back as memoryviews, fresh ones as arrays
+        def isCached(path: pathlib.Path, **options) -> bool:
+            obj = decode(path, cache=True, **options)[0]
+            return isinstance(obj.faces.corners, memoryview)
+
+        with tempfile.TemporaryDirectory() as folder:
+            for hashContent in (True, False):
+                original = pathlib.Path(folder, f"original{hashContent}", "cube.obj")
+                copy = pathlib.Path(folder, f"copy{hashContent}")
+                original.parent.mkdir()
+                original.write_text(TEST_CASE_PATH.read_text())
+
+                self.assertFalse(isCached(original, cacheHash=hashContent))
+                self.assertTrue(isCached(original, cacheHash=hashContent))
+
+                # the sidecar is copied along, only a content key still fits
+                shutil.copytree(original.parent, copy)
+                os.utime(copy / "cube.obj", ns=(0, 0))
+                self.assertEqual(
+                    isCached(copy / "cube.obj", cacheHash=hashContent), hashContent
+                )
+
+    def test_exportFormatsSectionsInBulk(self):
+        source = "\n".join(
+            ["o bulk", "v 1 2 3", "v 1 2 3 0.5", "v -1 0.25 3 1", "vt 0.5 1"]
+            + ["vn 0 0 1", "usemtl a", "f 1 2 3", "f 1/1 2/1 3/1", "usemtl b"]
+            + ["f 1//1 2//1 3//1 1//1", "f 1/1/1 2/1/1 3/1/1", "f 3/1/1 2/1/1 1/1/1"]
+        )
+
+        with tempfile.TemporaryDirectory() as folder:
+            path = pathlib.Path(folder, "bulk.obj")
+            decode(source)[0].export(path)
+            lines = path.read_text().splitlines()
+
+        self.assertEqual(
+            [line for line in lines if line and not line.startswith("#")],
+            [
+                "o bulk",
+                "v 1.000000 2.000000 3.000000",
+                "v 1.000000 2.000000 3.000000 0.500000",
+                "v -1.000000 0.250000 3.000000",
+                "vt 0.500000 1.000000",
+                "vn 0.000000 0.000000 1.000000",
+                "usemtl a",
+                "f 1 2 3",
+                "f 1/1 2/1 3/1",
+                "usemtl b",
+                "f 1//1 2//1 3//1 1//1",
+                "f 1/1/1 2/1/1 3/1/1",
+                "f 3/1/1 2/1/1 1/1/1",
+            ],
+        )
+
+    def test_exportToStreams(self):
+        obj = decode(TEST_CASE_PATH)[0]
+
+        chunks = list(obj.iterExport())
+        self.assertTrue(all(isinstance(chunk, bytes) for chunk in chunks))
+
+        text = io.StringIO()
+        obj.exportTo(text)
+
+        # everything past the timestamp line has to match
+        def body(data: str):
+            return data.split("\n", 2)[2]
+
+        self.assertEqual(body(b"".join(chunks).decode()), body(text.getvalue()))
+
+        compressed = io.BytesIO()
+        with gzip.GzipFile(fileobj=compressed, mode="wb") as stream:
+            obj.exportTo(stream)
+
+        self.assertEqual(
+            body(gzip.decompress(compressed.getvalue()).decode()),
+            body(text.getvalue()),
+        )
+
+    @unittest.skipIf(np is None, "numpy not installed")
+    def test_binaryMeshRoundTrips(self):
+        obj = decode(TEST_CASE_PATH, storage="numpy")[0]
+
+        with tempfile.TemporaryDirectory() as folder:
+            path = pathlib.Path(folder, "mesh.bin")
+            obj.exportBinary(path)
+
+            loaded = decodeBinary(path)
+            self.assertIsInstance(loaded.faces.corners, memoryview)
+            self.assertFalse(loaded.positions.flags.owndata)
+            self.assertTrue((loaded.positions == obj.positions).all())
+            self.assertEqual(loaded.faces.corners, obj.faces.corners)
+            self.assertEqual(loaded.materialNames, obj.materialNames)
+            self.assertEqual(
+                b"".join(loaded.iterExport()).split(b"\n", 2)[2],
+                b"".join(obj.iterExport()).split(b"\n", 2)[2],
+            )
+
+            # the first edit copies the faces out of the mapping
+            loaded.faces.indexers.append(obj.faces.getIndexers(0))
+            self.assertEqual(len(loaded.faces), len(obj.faces) + 1)
+
+            objects = decodeBinary(path, storage="objects")
+            self.assertEqual(len(objects.verticies), len(obj.positions))
+            del loaded, objects
+
+    def test_compressedFilesDecodeAndExport(self):
+        plain = decode(TEST_CASE_PATH)[0]
+
+        with tempfile.TemporaryDirectory() as folder:
+            plainPath = pathlib.Path(folder, "cube.obj")
+            plain.export(plainPath)
+
+            for suffix in (".gz", ".bz2", ".xz"):
+                path = pathlib.Path(folder, f"cube.obj{suffix}")
+                plain.export(path)
+                self.assertTrue(path.exists())
+
+                compressed = decode(path)[0]
+                self.assertEqual(compressed.name, plain.name)
+                self.assertEqual(compressed.faces.corners, plain.faces.corners)
+                self.assertEqual(
+                    [slotValues(v) for v in compressed.verticies],
+                    [slotValues(v) for v in plain.verticies],
+                )
+                self.assertEqual(
+                    [event.tag for event in iterDecode(path)],
+                    [event.tag for event in iterDecode(plainPath)],
+                )
+
+    def test_deterministicExportIsReproducible(self):
+        obj = decode("o zero\nv -0.0 0 -0.0000001\nvn 0 -0 1\nf 1//1 1//1 1//1")[0]
+
+        with tempfile.TemporaryDirectory() as folder:
+            exports = []
+            # the file name doesn't end up in the gzip header either
+            for name in ("a.obj.gz", "bbb.obj.gz"):
+                path = pathlib.Path(folder, name)
+                obj.export(path, deterministic=True)
+                exports.append(path.read_bytes())
+                sleep(0.01)
+
+        self.assertEqual(exports[0], exports[1])
+
+        text = b"".join(obj.iterExport(deterministic=True)).decode()
+        self.assertNotIn("Exported at", text)
+        self.assertIn("v 0.000000 0.000000 0.000000\n", text)
+        self.assertIn("vn 0.000000 0.000000 1.000000\n", text)
+
+    def test_parallelExportMatchesSequential(self):
+        obj = decode(OBJECT_FOLDER_PATH / "WusonOBJ.obj")[0]
+
+        sequential = b"".join(obj.iterExport(deterministic=True))
+        parallel = b"".join(obj.iterExport(deterministic=True, workers=2))
+
+        self.assertEqual(parallel, sequential)
+
+    def test_exportFloatFormats(self):
+        obj = decode("o f\nv 10 0.5 -2 1\nv 1e-7 123456789.125 0.1 2.5\nvt 0.25 0")[0]
+
+        def vertexLines(**options):
+            text = b"".join(obj.iterExport(deterministic=True, **options)).decode()
+            return [line for line in text.splitlines() if line[:2] in ("v ", "vt")]
+
+        self.assertEqual(
+            vertexLines(),
+            [
+                "v 10.000000 0.500000 -2.000000",
+                "v 0.000000 123456789.125000 0.100000 2.500000",
+                "vt 0.250000 0.000000",
+            ],
+        )
+        self.assertEqual(
+            vertexLines(floatFormat=FLOAT_FORMAT.TRIMMED),
+            ["v 10 0.5 -2", "v 0 123456789.125 0.1 2.5", "vt 0.25 0"],
+        )
+        self.assertEqual(
+            vertexLines(floatFormat="trimmed", digits=9),
+            ["v 10 0.5 -2", "v 0.0000001 123456789.125 0.1 2.5", "vt 0.25 0"],
+        )
+        self.assertEqual(
+            vertexLines(floatFormat="shortest"),
+            ["v 10.0 0.5 -2.0", "v 1e-07 123456789.125 0.1 2.5", "vt 0.25 0.0"],
+        )
+
+    def test_keepRawPassesUnchangedSectionsThrough(self):
+        source = "o raw\nv 1 2 3\nv 4 5 6\nvn 0 0 1\nusemtl a\nf 1//1 2//1 1//1\n"
+
+        with tempfile.TemporaryDirectory() as folder:
+            path = pathlib.Path(folder, "raw.obj")
+            path.write_text(source)
+
+            for storage in ("objects", "numpy") if np is not None else ("objects",):
+                obj = decode(path, storage=storage, keepRaw=True)[0]
+                self.assertIsNotNone(obj.raw)
+
+                def exported(**options) -> str:
+                    return b"".join(obj.iterExport(**options)).decode()
+
+                text = exported()
+                self.assertIn("\nv 1 2 3\nv 4 5 6\n", text)
+                self.assertIn("vn 0 0 1\n", text)
+                self.assertIn("usemtl a\nf 1//1 2//1 1//1\n", text)
+
+                # asking for a particular output always formats
+                self.assertIn("\nv 1.00 2.00 3.00\n", exported(digits=2))
+                self.assertIn("vn 0.0 0.0 1.0\n", exported(floatFormat="shortest"))
+                self.assertEqual(
+                    exported(deterministic=True),
+                    b"".join(decode(source)[0].iterExport(deterministic=True))
+                    .decode()
+                    .replace("o object", "o raw"),
+                )
+
+                # only the edited section is formatted again
+                obj.faces.renameMaterial(obj.materialNames[0], "b")
+                self.assertNotEqual(
+                    obj.sectionFingerprint(TAG_IDENTIFIER.POLYGONAL_FACE_ELEMENT),
+                    obj.raw.fingerprints[TAG_IDENTIFIER.POLYGONAL_FACE_ELEMENT],
+                )
+                text = exported()
+                self.assertIn("\nv 1 2 3\nv 4 5 6\n", text)
+                self.assertIn("usemtl b\nf 1//1 2//1 1//1\n", text)
+
+                if storage == "numpy":
+                    obj.positions[0, 0] = 7
+                else:
+                    obj.verticies[0].X = 7
+
+                self.assertIn("v 7.000000 2.000000 3.000000\n", exported())
+
+    def test_exportIncrementalRewritesOnlyChanges(self):
+        obj = decode(OBJECT_FOLDER_PATH / "WusonOBJ.obj")[0]
+
+        with tempfile.TemporaryDirectory() as folder:
+            path = pathlib.Path(folder, "wuson.obj")
+
+            def matchesFullExport():
+                expected = b"".join(obj.iterExport(deterministic=True))
+                self.assertEqual(path.read_bytes(), expected)
+
+            self.assertEqual(obj.exportIncremental(path), path.stat().st_size)
+            matchesFullExport()
+            self.assertEqual(obj.exportIncremental(path), 0)
+
+            # same length, patched in place
+            obj.verticies[10].X = 9 if obj.verticies[10].X < 0 else -9
+            written = obj.exportIncremental(path)
+            self.assertGreater(written, 0)
+            self.assertLess(written, path.stat().st_size // 4)
+            matchesFullExport()
+
+            # a new face at the end only formats that face
+            obj.faces.indexers.append(obj.faces.getIndexers(0))
+            self.assertLess(obj.exportIncremental(path), 100)
+            matchesFullExport()
+
+            obj.name = "a much longer name than before"
+            obj.linkedMTLLibs.append("extra.mtl")
+            obj.exportIncremental(path)
+            matchesFullExport()
+
+            # another float format rewrites everything
+            for options in ({"floatFormat": "shortest"}, {"digits": 2}, {}):
+                self.assertEqual(
+                    obj.exportIncremental(path, **options), path.stat().st_size
+                )
+                expected = b"".join(obj.iterExport(deterministic=True, **options))
+                self.assertEqual(path.read_bytes(), expected)
+                self.assertEqual(obj.exportIncremental(path, **options), 0)
+
+    @unittest.skipIf(np is None, "numpy not installed")
+    def test_exportGLB(self):
+        import json
+        import struct
+
+        obj = decode(pathlib.Path(OBJECT_FOLDER_PATH, "Many_Materials.obj"))[0]
+
+        with tempfile.TemporaryDirectory() as folder:
+            path = pathlib.Path(folder, "out.glb")
+            obj.exportGLB(path)
+            data = path.read_bytes()
+
+        magic, version, total = struct.unpack_from("<4sII", data)
+        self.assertEqual((magic, version, total), (b"glTF", 2, len(data)))
+
+        length, kind = struct.unpack_from("<I4s", data, 12)
+        self.assertEqual(kind, b"JSON")
+        document = json.loads(data[20 : 20 + length])
+        self.assertEqual(struct.unpack_from("<I4s", data, 20 + length)[1], b"BIN\x00")
+
+        used = set(obj.materialNames)
+        primitives = document["meshes"][0]["primitives"]
+        materials = document["materials"]
+        self.assertEqual({materials[p["material"]]["name"] for p in primitives}, used)
+
+        # shared corners are merged into one vertex
+        position = document["accessors"][primitives[0]["attributes"]["POSITION"]]
+        self.assertLess(position["count"], len(obj.faces.corners) // 3)
+
+        with self.assertRaises(ValueError):
+            decode("o empty\nv 0 0 0\nf 1 1\n")[0].exportGLB(path)
+
+    @unittest.skipIf(np is None, "numpy not installed")
+    def test_glbNormalsAreUnitLength(self):
+        from WaveFrontDOTPy import GLTF
+
+        text = "v 0 0 0\nv 1 0 0\nv 0 1 0\nvn 0 0 2\nf 1//1 2//1 3//1\n"
+        arrays = GLTF.buildPrimitives(decode(text)[0])[1]
+        self.assertTrue(np.allclose(np.linalg.norm(arrays["NORMAL"], axis=1), 1.0))
+
+        # one corner without a normal leaves NORMAL out altogether
+        arrays = GLTF.buildPrimitives(decode(text + "f 1 2 3\n")[0])[1]
+        self.assertNotIn("NORMAL", arrays)
+        self.assertIn("POSITION", arrays)
+
+    def test_relativeIndicesFollowTheFile(self):
+        # every face points back at the three v lines right before it
+        text = "".join(
+            f"v {i} 0 0\nv {i} 1 0\nv {i} 0 1\nvn 0 0 1\nf -3//-1 -2//-1 -1//-1\n"
+            for i in range(40)
+        )
+        expected = list(range(1, 121))
+
+        obj = decode(text)[0]
+        self.assertEqual(obj.faces.corners[0::3].tolist(), expected)
+        self.assertEqual(set(obj.faces.corners[2::3]), set(range(1, 41)))
+
+        with tempfile.TemporaryDirectory() as folder:
+            path = pathlib.Path(folder, "relative.obj")
+            path.write_text(text)
+
+            options = [{}, {"workers": 2}, {"workers": 5}]
+            if np is not None:
+                options.append({"storage": "numpy"})
+
+            for option in options:
+                corners = decode(path, **option)[0].faces.corners
+                self.assertEqual(corners, obj.faces.corners, option)
+
+        if np is not None:
+            from WaveFrontDOTPy import GLTF
+
+            arrays = GLTF.buildPrimitives(obj)[1]
+            self.assertEqual(len(np.unique(arrays["POSITION"], axis=0)), 120)
+
+    def test_elementClassesAreSlotted(self):
+        obj = decode(TEST_CASE_PATH)[0]
+
+        for element in (
+            Vertex(0.0, 0.0, 0.0),
+            VertexNormal(0.0, 0.0, 1.0),
+            VertexTexture(0.0, 0.0),
+            obj.faces.getIndexers(0)[0],
+        ):
+            self.assertFalse(hasattr(element, "__dict__"))
+
+        with self.assertRaises(AttributeError):
+            obj.verticies[0].color = 1
+
+    @unittest.skipIf(np is None, "numpy not installed")
+    def test_numpyStorageElementViews(self):
+        objects = decode(TEST_CASE_PATH)[0]
+        arrays = decode(TEST_CASE_PATH, storage="numpy")[0]
+
+        self.assertEqual(len(arrays.verticies), len(objects.verticies))
+        self.assertEqual(
+            [slotValues(v) for v in objects.verticies],
+            [{name: getattr(v, name) for name in "XYZW"} for v in arrays.verticies],
+        )
+        self.assertIsInstance(arrays.vertexNormals[-1], VertexNormal)
+
+        # writes go to the array, missing columns are added on demand
+        vertex = arrays.verticies[0]
+        vertex.X = 5.0
+        vertex.W = 2.0
+        self.assertEqual(arrays.positions[0].tolist()[::3], [5.0, 2.0])
+        self.assertEqual(arrays.verticies[1].W, 1.0)
+
+        arrays.verticies[1] = Vertex(1.0, 2.0, 3.0)
+        self.assertEqual(arrays.positions[1].tolist(), [1.0, 2.0, 3.0, 1.0])
+
+    def test_faceIndicesWidenOnOverflow(self):
+        obj = decode(TEST_CASE_PATH)[0]
+        self.assertEqual(obj.faces.corners.typecode, "H")
+
+        before = obj.faces.corners.tolist()
+        obj.faces.indexers.append(obj.faces.getIndexers(0))
+        obj.faces.addFace(
+            FACE_SHAPE_IDENTIFIER.VERTEX_ONLY, [70000, 0, 0, 1, 0, 0, -1, 0, 0]
+        )
+
+        self.assertEqual(obj.faces.corners.typecode, "i")
+        self.assertEqual(obj.faces.corners[: len(before)].tolist(), before)
+        self.assertEqual(obj.faces.corners[-9:].tolist()[::3], [70000, 1, -1])
+
+        for text in ("v 0 0 0\nf 1 2 3\nf -1 -2 -3\n", "v 0 0 0\nf 1 2 70000\n"):
+            self.assertEqual(decode(text)[0].faces.corners.typecode, "i")
+
+    @unittest.skipIf(np is None, "numpy not installed")
+    def test_float32Precision(self):
+        wuson = pathlib.Path(OBJECT_FOLDER_PATH, "WusonOBJ.obj")
+        wide = decode(wuson, storage="numpy")[0]
+        narrow = decode(wuson, storage="numpy", precision="float32")[0]
+
+        self.assertEqual(narrow.positions.dtype, np.float32)
+        self.assertEqual(narrow.positions.nbytes * 2, wide.positions.nbytes)
+
+        # 6 decimal source values print back unchanged, not as float32 noise
+        self.assertEqual(
+            b"".join(narrow.iterExport(deterministic=True)),
+            b"".join(wide.iterExport(deterministic=True)),
+        )
+
+        with tempfile.TemporaryDirectory() as folder:
+            path = pathlib.Path(folder, "narrow.obj")
+            path.write_bytes(
+                b"".join(narrow.iterExport(floatFormat=FLOAT_FORMAT.SHORTEST))
+            )
+            again = decode(path, storage="numpy", precision="float32")[0]
+
+        for name in ("positions", "normals", "uvs"):
+            self.assertTrue(np.array_equal(getattr(narrow, name), getattr(again, name)))
+
+        with self.assertRaises(ValueError):
+            decode(wuson, precision="float32")
+
+    def test_namesAreInterned(self):
+        text = (
+            "o thing\nmtllib a.mtl\ng some group\nv 0 0 0\n"
+            + "usemtl red paint\nf 1 1 1\nusemtl blue\nf 1 1 1\n" * 3
+        )
+
+        with tempfile.TemporaryDirectory() as folder:
+            path = pathlib.Path(folder, "names.obj")
+            path.write_text(text)
+            fromFile = decode(path)[0]
+
+        # str lines and mapped bytes lines
+        for obj in (decode(text)[0], fromFile):
+            symbols = obj.symbols
+            self.assertEqual(
+                symbols.names, ["thing", "a.mtl", "some group", "red paint", "blue"]
+            )
+            self.assertIs(obj.faces.materialNames[0], symbols[3])
+            self.assertIs(obj.linkedMTLLibs[0], symbols[1])
+
+            # runs and mtllibs hold ids from the same table
+            self.assertEqual(obj.materialRuns[0].materialId, 3)
+            self.assertEqual(obj.linkedMTLLibs.ids, [1])
+            self.assertNotIn("usemtl blue", symbols)
+
+        # a name that reads like an earlier line is still its own name
+        obj = decode("usemtl foo\no usemtl foo\nusemtl mtllib a.mtl\nv 0 0 0\nf 1 1 1")[
+            0
+        ]
+        self.assertEqual(obj.name, "usemtl foo")
+        self.assertEqual(obj.materialNames, ["mtllib a.mtl"])
+        self.assertEqual(obj.symbols.names, ["foo", "usemtl foo", "mtllib a.mtl"])
+        self.assertEqual(len(obj.symbols), 3)
+
+        materials = [
+            event.value
+            for event in iterDecode(text)
+            if event.tag is TAG_IDENTIFIER.USE_MTL_LIB
+        ]
+        self.assertEqual(len(materials), 6)
+        self.assertIs(materials[0], materials[2])
+
+    @unittest.skipIf(np is None, "numpy not installed")
+    def test_emptyNumpyObjectExports(self):
+        arrays = WaveObj("empty", STORAGE_MODE.NUMPY)
+        objects = WaveObj("empty")
+
+        self.assertEqual(
+            b"".join(arrays.iterExport(deterministic=True)),
+            b"".join(objects.iterExport(deterministic=True)),
+        )
+
+        with tempfile.TemporaryDirectory() as folder:
+            path = pathlib.Path(folder, "empty.bin")
+            arrays.exportBinary(path)
+            self.assertEqual(len(decodeBinary(path).verticies), 0)
+
+    def test_vertexBlocksCheckEveryLine(self):
+        colours = "v 1 2 3\nv 1 2 3\nv 1 2 3 0.1 0.2 0.3\n" * 3
+        shortAndLong = "v 1 2\nv 1 2 3 4\n" * 5
+
+        with tempfile.TemporaryDirectory() as folder:
+            path = pathlib.Path(folder, "bad.obj")
+
+            for body in (colours, shortAndLong):
+                path.write_text(body * 20)
+
+                for storage in ("objects", "numpy") if np is not None else ("objects",):
+                    # the line by line path without numpy fails in Vertex()
+                    with self.assertRaises((ShapeException, TypeError)):
+                        decode(path, storage=storage)
+
+    def test_deterministicExportKeepsNames(self):
+        obj = decode("o part -0 left\nv -0.0000001 1 -0\nusemtl mat -0 x\nf 1 1 1\n")[0]
+        obj.linkedMTLLibs.append("lib -0.mtl")
+
+        text = b"".join(obj.iterExport(deterministic=True)).decode()
+
+        self.assertIn("o part -0 left\n", text)
+        self.assertIn("usemtl mat -0 x\n", text)
+        self.assertIn("mtllib lib -0.mtl\n", text)
+        self.assertIn("v 0.000000 1.000000 0.000000\n", text)